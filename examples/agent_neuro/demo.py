@@ -4,22 +4,25 @@ Agent-Neuro Personality Demo
 Demonstrates the Neuro personality system and ontogenetic kernel evolution.
 """
 
+import contextlib
+import heapq
+import io
+import multiprocessing
 import sys
 import os
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
-from python.helpers.neuro_personality import NeuroPersonality, PersonalityTensor
-from python.helpers.ontogenetic_kernel import (
-    OntogeneticKernel,
-    initialize_neuro_kernel,
-    evolve_population,
-)
+# The personality/kernel helpers pull in numpy (and numba when installed),
+# which dominates cold-start time; import them lazily inside each demo so
+# the banner appears instantly and each worker process imports on demand.
 
 
 def demo_personality():
     """Demonstrate personality system."""
+    from python.helpers.neuro_personality import NeuroPersonality
+
     print("=" * 60)
     print("AGENT-NEURO PERSONALITY DEMO")
     print("=" * 60)
@@ -80,6 +83,9 @@ def demo_personality():
 
 def demo_ontogenetic_kernel():
     """Demonstrate ontogenetic kernel and self-evolution."""
+    from python.helpers.neuro_personality import NeuroPersonality
+    from python.helpers.ontogenetic_kernel import initialize_neuro_kernel, evolve_population
+
     print("\n" + "=" * 60)
     print("ONTOGENETIC KERNEL DEMO")
     print("=" * 60)
@@ -145,7 +151,8 @@ def demo_ontogenetic_kernel():
     evolved_pop = evolve_population(population, generations=5)
     
     print(f"   Evolved population fitnesses:")
-    for i, k in enumerate(sorted(evolved_pop, key=lambda x: x.genome.fitness, reverse=True)):
+    ranked = heapq.nlargest(len(evolved_pop), evolved_pop, key=lambda x: x.genome.fitness)
+    for i, k in enumerate(ranked):
         print(f"     Kernel {i}: {k.genome.fitness:.3f} (gen {k.genome.generation})")
     
     print("\n6. Applying Kernel to Personality:")
@@ -166,6 +173,9 @@ def demo_ontogenetic_kernel():
 
 def demo_serialization():
     """Demonstrate personality and kernel serialization."""
+    from python.helpers.neuro_personality import NeuroPersonality
+    from python.helpers.ontogenetic_kernel import OntogeneticKernel, initialize_neuro_kernel
+
     print("\n" + "=" * 60)
     print("SERIALIZATION DEMO")
     print("=" * 60)
@@ -201,18 +211,38 @@ def demo_serialization():
     print(f"   Restored fitness: {restored_kernel.genome.fitness:.3f}")
 
 
+def _run_demo(demo_fn) -> str:
+    """Run one demo function in a worker process, returning its output."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        demo_fn()
+    return buffer.getvalue()
+
+
+BANNER = "\n".join([
+    "",
+    "",
+    "╔══════════════════════════════════════════════════════════╗",
+    "║         AGENT-NEURO: CHAOTIC COGNITIVE VTUBER AI        ║",
+    "║   Where Chaos Meets Cognition, Personality Meets Code   ║",
+    "╚══════════════════════════════════════════════════════════╝",
+    "",
+    "",
+    "",
+])
+
+
 if __name__ == "__main__":
-    print("\n")
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║         AGENT-NEURO: CHAOTIC COGNITIVE VTUBER AI        ║")
-    print("║   Where Chaos Meets Cognition, Personality Meets Code   ║")
-    print("╚══════════════════════════════════════════════════════════╝")
-    print("\n")
+    # One buffered write instead of a print call per banner line
+    sys.stdout.write(BANNER)
     
     try:
-        demo_personality()
-        demo_ontogenetic_kernel()
-        demo_serialization()
+        # The three demos are independent, so run them in parallel worker
+        # processes; output is captured per demo and printed in order
+        demos = [demo_personality, demo_ontogenetic_kernel, demo_serialization]
+        with multiprocessing.Pool(processes=len(demos)) as pool:
+            for output in pool.imap(_run_demo, demos):
+                print(output, end="")
         
         print("\n" + "=" * 60)
         print("DEMO COMPLETE!")
@@ -9,13 +9,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 from python.helpers.neuro_personality import NeuroPersonality
 from python.helpers.ontogenetic_kernel import initialize_neuro_kernel
 
+# Shared read-only parent: inherit() never mutates the parent, so tests that
+# only derive children reuse one module-level singleton
+SHARED_PARENT = NeuroPersonality()
+
 
 def test_personality_inheritance():
     """Test personality inheritance creates variation."""
     print("\n1. Testing Basic Personality Inheritance")
     
     # Create parent
-    parent = NeuroPersonality()
+    parent = SHARED_PARENT
     print(f"   Parent personality:")
     print(f"     Chaotic: {parent.personality.chaotic:.3f}")
     print(f"     Sarcasm: {parent.personality.sarcasm:.3f}")
@@ -75,7 +79,7 @@ def test_multi_generation_inheritance():
     print("\n3. Testing Multi-Generation Inheritance")
     
     # Generation 0
-    gen0 = NeuroPersonality()
+    gen0 = SHARED_PARENT
     print(f"   Gen 0: chaotic={gen0.personality.chaotic:.3f}")
     
     # Generation 1
@@ -108,7 +112,7 @@ def test_custom_inheritance_overrides():
     print("\n4. Testing Custom Inheritance Overrides")
     
     # Create parent
-    parent = NeuroPersonality()
+    parent = SHARED_PARENT
     
     # Inherit with custom overrides
     child_tensor = parent.personality.inherit(0.7)
@@ -139,7 +143,7 @@ def test_inheritance_statistics():
     """Test statistical properties of inheritance."""
     print("\n5. Testing Inheritance Statistics")
     
-    parent = NeuroPersonality()
+    parent = SHARED_PARENT
     parent_chaotic = parent.personality.chaotic
     
     # Create many children
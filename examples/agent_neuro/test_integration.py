@@ -4,8 +4,21 @@ Test Agent-Neuro integration components
 
 import sys
 import os
+from functools import lru_cache
+from pathlib import Path
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
+# Repo root resolved once; individual tests build paths from this instead of
+# re-deriving dirname/join chains per check
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@lru_cache(maxsize=None)
+def _path_exists(relative: str) -> bool:
+    """Memoized existence check for repo-relative paths."""
+    return (ROOT / relative).exists()
+
 
 def test_personality_module():
     """Test personality module can be imported."""
@@ -34,39 +47,29 @@ def test_kernel_module():
 
 def test_extension_files_exist():
     """Test that extension files exist."""
-    import os
-    
-    extensions_dir = os.path.join(os.path.dirname(__file__), '../..', 'python', 'extensions')
-    
     # Check personality integration extension
-    personality_ext = os.path.join(extensions_dir, 'message_loop_start', 'neuro_personality_integration.py')
-    assert os.path.exists(personality_ext), f"Extension not found: {personality_ext}"
-    print(f"✓ Found: {personality_ext}")
+    personality_ext = 'python/extensions/message_loop_start/neuro_personality_integration.py'
+    assert _path_exists(personality_ext), f"Extension not found: {ROOT / personality_ext}"
+    print(f"✓ Found: {ROOT / personality_ext}")
     
     # Check response enhancement extension
-    response_ext = os.path.join(extensions_dir, 'message_loop_end', 'neuro_response_enhancement.py')
-    assert os.path.exists(response_ext), f"Extension not found: {response_ext}"
-    print(f"✓ Found: {response_ext}")
+    response_ext = 'python/extensions/message_loop_end/neuro_response_enhancement.py'
+    assert _path_exists(response_ext), f"Extension not found: {ROOT / response_ext}"
+    print(f"✓ Found: {ROOT / response_ext}")
 
 
 def test_tool_file_exists():
     """Test that personality tool exists."""
-    import os
-    
-    tools_dir = os.path.join(os.path.dirname(__file__), '../..', 'python', 'tools')
-    tool_file = os.path.join(tools_dir, 'neuro_personality.py')
-    
-    assert os.path.exists(tool_file), f"Tool not found: {tool_file}"
-    print(f"✓ Found: {tool_file}")
+    tool_file = 'python/tools/neuro_personality.py'
+    assert _path_exists(tool_file), f"Tool not found: {ROOT / tool_file}"
+    print(f"✓ Found: {ROOT / tool_file}")
 
 
 def test_config_exists():
     """Test that configuration file exists."""
-    import os
-    
-    config_file = os.path.join(os.path.dirname(__file__), '../..', 'config', 'agent_neuro.yaml')
-    assert os.path.exists(config_file), f"Config not found: {config_file}"
-    print(f"✓ Found: {config_file}")
+    config_file = 'config/agent_neuro.yaml'
+    assert _path_exists(config_file), f"Config not found: {ROOT / config_file}"
+    print(f"✓ Found: {ROOT / config_file}")
 
 
 if __name__ == "__main__":
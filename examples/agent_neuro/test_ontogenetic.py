@@ -37,10 +37,14 @@ def test_gene_mutation():
         max_value=1.0
     )
     
-    # Mutate many times
+    # Mutate many times in place (no per-iteration gene allocation)
     for _ in range(100):
-        mutated = gene.mutate(intensity=1.0)
-        assert mutated.min_value <= mutated.value <= mutated.max_value
+        gene.mutate_in_place(intensity=1.0)
+        assert gene.min_value <= gene.value <= gene.max_value
+    
+    # The copying variant still works and stays in bounds
+    mutated = gene.mutate(intensity=1.0)
+    assert mutated.min_value <= mutated.value <= mutated.max_value
     
     print("✓ Gene mutation test passed")
 
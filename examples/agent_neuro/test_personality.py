@@ -8,10 +8,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from python.helpers.neuro_personality import NeuroPersonality, PersonalityTensor
 
+# Shared read-only instance: constructing NeuroPersonality is not free, so
+# tests that never mutate it reuse one module-level singleton
+SHARED_NEURO = NeuroPersonality()
+
 
 def test_personality_creation():
     """Test creating personality with default values."""
-    neuro = NeuroPersonality()
+    neuro = SHARED_NEURO
     assert neuro.personality.playfulness == 0.95
     assert neuro.personality.chaotic == 0.95
     assert neuro.personality.sarcasm == 0.90
@@ -37,7 +41,7 @@ def test_ethical_constraints():
 
 def test_personality_inheritance():
     """Test personality inheritance creates variation."""
-    parent = NeuroPersonality()
+    parent = SHARED_NEURO
     child_tensor = parent.personality.inherit(inheritance_factor=0.7)
     
     # Child should have similar but not identical values
@@ -52,7 +56,7 @@ def test_personality_inheritance():
 
 def test_action_optimization():
     """Test multi-objective action optimization."""
-    neuro = NeuroPersonality()
+    neuro = SHARED_NEURO
     
     # Good action
     action = {"causes_harm": False}
@@ -11,9 +11,7 @@ Demonstrates fundamental agent atom types in the OpenCog AtomSpace:
 This forms the foundation for cognitive agent representation.
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+import _path_setup  # noqa: F401  (adds the repo root to sys.path once)
 
 from python.helpers.opencog_atomspace import AtomSpace
 import json
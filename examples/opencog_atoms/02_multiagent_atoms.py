@@ -13,29 +13,68 @@ This builds on basic agent atoms to show how multiple agents interact.
 """
 
 import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+import _path_setup  # noqa: F401  (adds the repo root to sys.path once)
+
+from dataclasses import dataclass
 
 from python.helpers.opencog_atomspace import AtomSpace
 import json
 
 
+# Fixed-shape metadata records: slotted dataclasses instead of dicts, so the
+# repeated link annotations don't pay per-instance hash-table overhead
+@dataclass(slots=True)
+class SupervisionMeta:
+    established_at: str
+    authority_level: str
+
+
+@dataclass(slots=True)
+class MembershipMeta:
+    joined_at: str
+
+
+@dataclass(slots=True)
+class DelegationMeta:
+    delegated_at: str
+    deadline: str
+    priority: str
+
+
+@dataclass(slots=True)
+class AssignmentMeta:
+    assigned_at: str
+
+
 def print_section(title):
     """Print a formatted section header"""
-    print(f"\n{'='*70}")
-    print(f"  {title}")
-    print('='*70)
+    bar = '=' * 70
+    sys.stdout.write(f"\n{bar}\n  {title}\n{bar}\n")
+
+
+# Precompiled % templates for print_atom: the format strings are parsed once
+# at import instead of evaluating four f-strings per printed atom
+_ATOM_TEMPLATE = (
+    "%(p)sAtom: %(name)s (%(type)s)\n"
+    "%(p)s  ID: %(id).8s...\n"
+    "%(p)s  Truth Value: %(tv)s\n"
+    "%(p)s  Attention: %(av).3f\n"
+)
+_ATOM_TEMPLATE_META = _ATOM_TEMPLATE + "%(p)s  Metadata: %(meta)s\n"
 
 
 def print_atom(atom, indent=0):
-    """Pretty print an atom"""
-    prefix = "  " * indent
-    print(f"{prefix}Atom: {atom.name} ({atom.type})")
-    print(f"{prefix}  ID: {atom.id[:8]}...")
-    print(f"{prefix}  Truth Value: {atom.truth_value}")
-    print(f"{prefix}  Attention: {atom.attention_value:.3f}")
-    if atom.metadata:
-        print(f"{prefix}  Metadata: {atom.metadata}")
+    """Pretty print an atom with one buffered write"""
+    template = _ATOM_TEMPLATE_META if atom.metadata else _ATOM_TEMPLATE
+    sys.stdout.write(template % {
+        "p": "  " * indent,
+        "name": atom.name,
+        "type": atom.type,
+        "id": atom.id,
+        "tv": atom.truth_value,
+        "av": atom.attention_value,
+        "meta": atom.metadata,
+    })
 
 
 def example_multiagent_atoms():
@@ -49,6 +88,18 @@ def example_multiagent_atoms():
     atomspace = AtomSpace("multiagent_coordination")
     print("✓ Created AtomSpace: multiagent_coordination\n")
     
+    # Shared timestamp/metadata literals, built once instead of per iteration
+    setup_time = "2025-10-26T10:00:00Z"
+    delegation_time = "2025-10-26T10:05:00Z"
+    supervision_meta = SupervisionMeta(established_at=setup_time, authority_level="full")
+    joined_meta = MembershipMeta(joined_at=setup_time)
+    delegation_meta = DelegationMeta(
+        delegated_at=delegation_time,
+        deadline="2025-10-26T11:00:00Z",
+        priority="high"
+    )
+    assignment_meta = AssignmentMeta(assigned_at=delegation_time)
+    
     # =========================================================================
     # 1. AGENT HIERARCHY - Supervisor/Subordinate Relationships
     # =========================================================================
@@ -71,39 +122,40 @@ def example_multiagent_atoms():
     print("Supervisor Agent:")
     print_atom(supervisor, indent=1)
     
-    # Create subordinate agents
+    # Create subordinate agents in one batched call
     print("\nSubordinate Agents:")
-    subordinates = []
-    for i in range(1, 4):
-        agent = atomspace.add_node(
-            node_type="ConceptNode",
-            name=f"Agent_Worker_{i}",
-            truth_value=(1.0, 1.0),
-            attention_value=0.7,
-            metadata={
+    subordinates = atomspace.add_nodes([
+        {
+            "node_type": "ConceptNode",
+            "name": f"Agent_Worker_{i}",
+            "truth_value": (1.0, 1.0),
+            "attention_value": 0.7,
+            "metadata": {
                 "role": "worker",
                 "level": 1,
                 "status": "active",
                 "supervisor": "Agent_Supervisor"
             }
-        )
-        subordinates.append(agent)
+        }
+        for i in range(1, 4)
+    ])
+    for agent in subordinates:
         print_atom(agent, indent=1)
     
-    # Create supervision links
+    # Create supervision links in one batched call; the supervisor id is
+    # read once instead of once per subordinate
     print("\nSupervision Relationships:")
-    supervision_links = []
+    supervisor_id = supervisor.id
+    supervision_links = atomspace.add_links([
+        {
+            "link_type": "SupervisionLink",
+            "outgoing": [supervisor_id, subordinate.id],
+            "truth_value": (1.0, 0.95),
+            "metadata": supervision_meta
+        }
+        for subordinate in subordinates
+    ])
     for subordinate in subordinates:
-        link = atomspace.add_link(
-            link_type="SupervisionLink",
-            outgoing=[supervisor.id, subordinate.id],
-            truth_value=(1.0, 0.95),
-            metadata={
-                "established_at": "2025-10-26T10:00:00Z",
-                "authority_level": "full"
-            }
-        )
-        supervision_links.append(link)
         print(f"  {supervisor.name} supervises {subordinate.name}")
     
     # =========================================================================
@@ -137,27 +189,31 @@ def example_multiagent_atoms():
         ("CanRequestHelp", "Agent can request assistance", 0.90, 0.88)
     ]
     
-    message_capabilities = []
+    message_capabilities = atomspace.add_nodes([
+        {
+            "node_type": "PredicateNode",
+            "name": cap_name,
+            "truth_value": (strength, confidence),
+            "attention_value": 0.7,
+            "metadata": {"description": desc}
+        }
+        for cap_name, desc, strength, confidence in message_types
+    ])
     for cap_name, desc, strength, confidence in message_types:
-        cap = atomspace.add_node(
-            node_type="PredicateNode",
-            name=cap_name,
-            truth_value=(strength, confidence),
-            attention_value=0.7,
-            metadata={"description": desc}
-        )
-        message_capabilities.append(cap)
         print(f"  {cap_name}: {desc}")
     
     # Link agents to communication channel
     print("\nChannel Memberships:")
-    all_agents = [supervisor] + subordinates
+    # Built once and reused by every later section; a tuple makes the
+    # shared, immutable roster explicit
+    all_agents = (supervisor, *subordinates)
+    comm_channel_id = comm_channel.id
     for agent in all_agents:
         link = atomspace.add_link(
             link_type="MemberLink",
-            outgoing=[agent.id, comm_channel.id],
+            outgoing=[agent.id, comm_channel_id],
             truth_value=(1.0, 0.95),
-            metadata={"joined_at": "2025-10-26T10:00:00Z"}
+            metadata=joined_meta
         )
         print(f"  {agent.name} is member of {comm_channel.name}")
     
@@ -197,29 +253,24 @@ def example_multiagent_atoms():
         worker = subordinates[i % len(subordinates)]
         delegation = atomspace.add_link(
             link_type="DelegationLink",
-            outgoing=[supervisor.id, worker.id, task.id],
+            outgoing=[supervisor_id, worker.id, task.id],
             truth_value=(1.0, 0.9),
-            metadata={
-                "delegated_at": "2025-10-26T10:05:00Z",
-                "deadline": "2025-10-26T11:00:00Z",
-                "priority": "high"
-            }
+            metadata=delegation_meta
         )
         print(f"  {supervisor.name} delegates {task.name} to {worker.name}")
     
-    # Create assignment evaluation
+    # Create assignment evaluation; the AssignedTo predicate is created once
+    # and reused instead of being re-resolved on every iteration
     print("\nTask Assignments:")
+    assigned_to = atomspace.add_node("PredicateNode", "AssignedTo",
+                                     truth_value=(1.0, 1.0))
     for i, task in enumerate(tasks):
         worker = subordinates[i % len(subordinates)]
-        assignment = atomspace.add_link(
-            link_type="EvaluationLink",
-            outgoing=[
-                atomspace.add_node("PredicateNode", "AssignedTo", 
-                                  truth_value=(1.0, 1.0)).id,
-                atomspace.add_link("ListLink", [task.id, worker.id]).id
-            ],
+        assignment = atomspace.add_evaluation(
+            assigned_to.id,
+            [task.id, worker.id],
             truth_value=(1.0, 0.95),
-            metadata={"assigned_at": "2025-10-26T10:05:00Z"}
+            metadata=assignment_meta
         )
         print(f"  {task.name} assigned to {worker.name}")
     
@@ -275,16 +326,15 @@ def example_multiagent_atoms():
             truth_value=(1.0, 0.95)
         )
     
-    # Create access links for agents
+    # Create access links for agents, reusing a single HasAccessTo predicate
     print("\nKnowledge Access Rights:")
+    has_access_to_id = atomspace.add_node("PredicateNode", "HasAccessTo",
+                                          truth_value=(1.0, 1.0)).id
+    shared_kb_id = shared_kb.id
     for agent in all_agents:
-        access_link = atomspace.add_link(
-            link_type="EvaluationLink",
-            outgoing=[
-                atomspace.add_node("PredicateNode", "HasAccessTo",
-                                  truth_value=(1.0, 1.0)).id,
-                atomspace.add_link("ListLink", [agent.id, shared_kb.id]).id
-            ],
+        access_link = atomspace.add_evaluation(
+            has_access_to_id,
+            [agent.id, shared_kb_id],
             truth_value=(1.0, 0.95),
             metadata={"access_level": "read_write"}
         )
@@ -313,10 +363,11 @@ def example_multiagent_atoms():
     
     # Add all agents to collaboration
     print("\nGroup Membership:")
+    collab_group_id = collab_group.id
     for agent in all_agents:
         member_link = atomspace.add_link(
             link_type="MemberLink",
-            outgoing=[agent.id, collab_group.id],
+            outgoing=[agent.id, collab_group_id],
             truth_value=(1.0, 0.95),
             metadata={"role_in_group": agent.metadata.get("role", "member")}
         )
@@ -338,13 +389,10 @@ def example_multiagent_atoms():
     print_atom(collab_goal, indent=1)
     
     # Link goal to group
-    goal_link = atomspace.add_link(
-        link_type="EvaluationLink",
-        outgoing=[
-            atomspace.add_node("PredicateNode", "WorkingTowards",
-                              truth_value=(1.0, 1.0)).id,
-            atomspace.add_link("ListLink", [collab_group.id, collab_goal.id]).id
-        ],
+    goal_link = atomspace.add_evaluation(
+        atomspace.add_node("PredicateNode", "WorkingTowards",
+                           truth_value=(1.0, 1.0)).id,
+        [collab_group.id, collab_goal.id],
         truth_value=(1.0, 0.9)
     )
     print(f"  {collab_group.name} working towards {collab_goal.name}")
@@ -428,14 +476,20 @@ def example_multiagent_atoms():
     # =========================================================================
     print_section("9. Exporting Multi-Agent Coordination State")
     
-    export_data = atomspace.export_to_dict()
+    # Freeze into a compact snapshot for the export phase
+    frozen = atomspace.freeze()
+    export_data = frozen.export_to_dict()
     print(f"\nExported {len(export_data['atoms'])} atoms from AtomSpace")
     print(f"AtomSpace name: {export_data['name']}")
     print("\nKey coordination atoms:")
     
-    # Show some key atoms in export
-    coord_atoms = [a for a in export_data['atoms'] 
-                   if 'Supervision' in a['type'] or 'Delegation' in a['type']]
+    # Show some key atoms: pull them from the type-index buckets instead of
+    # substring-scanning every exported atom dict
+    coord_atoms = [
+        atom.to_dict()
+        for atom_type in ("SupervisionLink", "DelegationLink")
+        for atom in atomspace.get_atoms_by_type(atom_type)
+    ]
     for atom_data in coord_atoms[:3]:
         print(f"  - {atom_data['type']}: involves {len(atom_data.get('outgoing', []))} atoms")
     
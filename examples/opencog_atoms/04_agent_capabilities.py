@@ -14,29 +14,151 @@ This shows how to represent what agents can do and how they improve.
 """
 
 import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+import _path_setup  # noqa: F401  (adds the repo root to sys.path once)
 
 from python.helpers.opencog_atomspace import AtomSpace
-import json
+
+# Shared metadata templates for loops where every atom carries the same
+# keys; one dict serves the whole section instead of one per atom
+META_ACQUIRED = {"acquired_at": "2025-10-26T10:00:00Z"}
+META_ASSESSED = {"assessed_at": "2025-10-26T10:30:00Z"}
+
+# Static vocabularies, hoisted to module level and partially evaluated
+# into add_nodes spec lists once at import instead of on every call
+
+# (name, description, category, strength, confidence)
+TOOLS = [
+    ("Tool_CodeExecution", "Execute Python/Bash code", "execution", 0.98, 0.95),
+    ("Tool_WebBrowser", "Browse and interact with web", "browsing", 0.92, 0.90),
+    ("Tool_FileSystem", "File and directory operations", "file_ops", 0.95, 0.93),
+    ("Tool_WebSearch", "Search the internet", "search", 0.90, 0.88),
+    ("Tool_Memory", "Store and retrieve memories", "memory", 0.96, 0.94),
+    ("Tool_Vision", "Analyze images and screenshots", "vision", 0.88, 0.85),
+    ("Tool_Scheduler", "Schedule and manage tasks", "scheduling", 0.91, 0.89),
+    ("Tool_OpenCog", "Access cognitive AtomSpace", "cognition", 0.94, 0.92)
+]
+
+# (name, description, strength, confidence)
+BASE_CAPABILITIES = [
+    ("Capability_Reasoning", "Logical reasoning and inference", 0.95, 0.90),
+    ("Capability_Planning", "Task planning and decomposition", 0.93, 0.88),
+    ("Capability_Learning", "Learning from experience", 0.90, 0.85),
+    ("Capability_Communication", "Inter-agent communication", 0.96, 0.92),
+    ("Capability_ToolUse", "Using available tools", 0.94, 0.91),
+    ("Capability_ProblemSolving", "Solving complex problems", 0.91, 0.87),
+    ("Capability_Adaptation", "Adapting to new situations", 0.88, 0.84)
+]
+
+# (name, base capability, description)
+SPECIALIZED_CAPS = [
+    ("Capability_PythonCoding", "Capability_ToolUse", "Python programming"),
+    ("Capability_WebScraping", "Capability_ToolUse", "Web data extraction"),
+    ("Capability_DataAnalysis", "Capability_Reasoning", "Data analysis and statistics"),
+    ("Capability_TaskBreakdown", "Capability_Planning", "Breaking tasks into subtasks"),
+    ("Capability_PatternRecognition", "Capability_Learning", "Recognizing patterns")
+]
+
+# (name, score, description)
+PROFICIENCY_LEVELS = [
+    ("Proficiency_Novice", 0.3, "Just learning, basic understanding"),
+    ("Proficiency_Beginner", 0.5, "Can perform simple tasks"),
+    ("Proficiency_Intermediate", 0.7, "Competent, handles most tasks"),
+    ("Proficiency_Advanced", 0.85, "Highly skilled, efficient"),
+    ("Proficiency_Expert", 0.95, "Mastery level, innovative")
+]
+
+TOOL_NODE_SPECS = [
+    {
+        "node_type": "ConceptNode",
+        "name": tool_name,
+        "truth_value": (strength, confidence),
+        "attention_value": 0.75,
+        "metadata": {
+            "description": desc,
+            "category": category,
+            "available": True,
+            "version": "1.0"
+        }
+    }
+    for tool_name, desc, category, strength, confidence in TOOLS
+]
+
+BASE_CAP_SPECS = [
+    {
+        "node_type": "PredicateNode",
+        "name": cap_name,
+        "truth_value": (strength, confidence),
+        "attention_value": 0.80,
+        "metadata": {
+            "description": desc,
+            "type": "base_capability",
+            "learnable": True
+        }
+    }
+    for cap_name, desc, strength, confidence in BASE_CAPABILITIES
+]
+
+SPEC_CAP_SPECS = [
+    {
+        "node_type": "PredicateNode",
+        "name": spec_name,
+        "truth_value": (0.85, 0.80),
+        "attention_value": 0.70,
+        "metadata": {
+            "description": desc,
+            "type": "specialized_capability"
+        }
+    }
+    for spec_name, base_name, desc in SPECIALIZED_CAPS
+]
+
+PROFICIENCY_SPECS = [
+    {
+        "node_type": "ConceptNode",
+        "name": prof_name,
+        "truth_value": (score, 0.9),
+        "attention_value": score,
+        "metadata": {
+            "description": desc,
+            "score": score
+        }
+    }
+    for prof_name, score, desc in PROFICIENCY_LEVELS
+]
+
+# Pre-bound row formatter for the learning-event table: the format spec
+# is parsed once here instead of per f-string evaluation in the loop
+LEARNING_ROW = "  {:<12} {:<25} {:<8.2f} {:<25} {}".format
+
+# The tool, base-capability and proficiency vocabularies have no
+# cross-dependencies, so they land in the AtomSpace in one fused bulk
+# insert instead of one batch per section
+FUSED_VOCAB_SPECS = TOOL_NODE_SPECS + BASE_CAP_SPECS + PROFICIENCY_SPECS
 
 
 def print_section(title):
-    """Print a formatted section header"""
-    print(f"\n{'='*70}")
-    print(f"  {title}")
-    print('='*70)
+    """Print a formatted section header with one buffered write"""
+    bar = '=' * 70
+    sys.stdout.write(f"\n{bar}\n  {title}\n{bar}\n")
+
+
+def print_lines(lines):
+    """Emit many lines with a single stdout write (one lock, one flush)"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_atom(atom, indent=0):
-    """Pretty print an atom"""
+    """Pretty print an atom with one buffered write"""
     prefix = "  " * indent
-    print(f"{prefix}Atom: {atom.name} ({atom.type})")
-    print(f"{prefix}  ID: {atom.id[:8]}...")
-    print(f"{prefix}  Truth Value: {atom.truth_value}")
-    print(f"{prefix}  Attention: {atom.attention_value:.3f}")
+    lines = [
+        f"{prefix}Atom: {atom.name} ({atom.type})",
+        f"{prefix}  ID: {atom.id[:8]}...",
+        f"{prefix}  Truth Value: {atom.truth_value}",
+        f"{prefix}  Attention: {atom.attention_value:.3f}",
+    ]
     if atom.metadata:
-        print(f"{prefix}  Metadata: {atom.metadata}")
+        lines.append(f"{prefix}  Metadata: {atom.metadata}")
+    print_lines(lines)
 
 
 def example_agent_capabilities():
@@ -46,9 +168,13 @@ def example_agent_capabilities():
     print("\nThis example shows how to represent agent capabilities and tools")
     print("using atoms in the OpenCog AtomSpace cognitive architecture.\n")
     
-    # Create an AtomSpace
+    # Create an AtomSpace and seed the independent vocabularies in one pass
     atomspace = AtomSpace("agent_capabilities_tools")
     print("✓ Created AtomSpace: agent_capabilities_tools\n")
+
+    seeded = atomspace.add_nodes(FUSED_VOCAB_SPECS)
+    n_tools = len(TOOL_NODE_SPECS)
+    n_caps = len(BASE_CAP_SPECS)
     
     # =========================================================================
     # 1. TOOL DEFINITIONS - Available Tools
@@ -56,33 +182,10 @@ def example_agent_capabilities():
     print_section("1. Tool Definitions")
     print("\nDefining available tools in the system:\n")
     
-    tools = [
-        ("Tool_CodeExecution", "Execute Python/Bash code", "execution", 0.98, 0.95),
-        ("Tool_WebBrowser", "Browse and interact with web", "browsing", 0.92, 0.90),
-        ("Tool_FileSystem", "File and directory operations", "file_ops", 0.95, 0.93),
-        ("Tool_WebSearch", "Search the internet", "search", 0.90, 0.88),
-        ("Tool_Memory", "Store and retrieve memories", "memory", 0.96, 0.94),
-        ("Tool_Vision", "Analyze images and screenshots", "vision", 0.88, 0.85),
-        ("Tool_Scheduler", "Schedule and manage tasks", "scheduling", 0.91, 0.89),
-        ("Tool_OpenCog", "Access cognitive AtomSpace", "cognition", 0.94, 0.92)
-    ]
-    
-    tool_nodes = []
-    for tool_name, desc, category, strength, confidence in tools:
-        tool = atomspace.add_node(
-            node_type="ConceptNode",
-            name=tool_name,
-            truth_value=(strength, confidence),
-            attention_value=0.75,
-            metadata={
-                "description": desc,
-                "category": category,
-                "available": True,
-                "version": "1.0"
-            }
-        )
-        tool_nodes.append(tool)
-        print(f"  {tool_name} ({category}): {desc}")
+    tool_nodes = seeded[:n_tools]
+    tool_by_name = {t.name: t for t in tool_nodes}
+    print_lines([f"  {tool_name} ({category}): {desc}"
+                 for tool_name, desc, category, _, _ in TOOLS])
     
     # =========================================================================
     # 2. BASE CAPABILITIES - Core Skills
@@ -90,31 +193,10 @@ def example_agent_capabilities():
     print_section("2. Base Capabilities - Core Skills")
     print("\nDefining fundamental agent capabilities:\n")
     
-    base_capabilities = [
-        ("Capability_Reasoning", "Logical reasoning and inference", 0.95, 0.90),
-        ("Capability_Planning", "Task planning and decomposition", 0.93, 0.88),
-        ("Capability_Learning", "Learning from experience", 0.90, 0.85),
-        ("Capability_Communication", "Inter-agent communication", 0.96, 0.92),
-        ("Capability_ToolUse", "Using available tools", 0.94, 0.91),
-        ("Capability_ProblemSolving", "Solving complex problems", 0.91, 0.87),
-        ("Capability_Adaptation", "Adapting to new situations", 0.88, 0.84)
-    ]
-    
-    capability_nodes = []
-    for cap_name, desc, strength, confidence in base_capabilities:
-        cap = atomspace.add_node(
-            node_type="PredicateNode",
-            name=cap_name,
-            truth_value=(strength, confidence),
-            attention_value=0.80,
-            metadata={
-                "description": desc,
-                "type": "base_capability",
-                "learnable": True
-            }
-        )
-        capability_nodes.append(cap)
-        print(f"  {cap_name}: {desc} (proficiency: {strength:.2f})")
+    capability_nodes = seeded[n_tools:n_tools + n_caps]
+    cap_by_name = {c.name: c for c in capability_nodes}
+    print_lines([f"  {cap_name}: {desc} (proficiency: {strength:.2f})"
+                 for cap_name, desc, strength, _ in BASE_CAPABILITIES])
     
     # =========================================================================
     # 3. CAPABILITY HIERARCHY - Inheritance Relationships
@@ -123,39 +205,26 @@ def example_agent_capabilities():
     print("\nEstablishing capability inheritance relationships:\n")
     
     # Create specialized capabilities that inherit from base
-    specialized_caps = [
-        ("Capability_PythonCoding", "Capability_ToolUse", "Python programming"),
-        ("Capability_WebScraping", "Capability_ToolUse", "Web data extraction"),
-        ("Capability_DataAnalysis", "Capability_Reasoning", "Data analysis and statistics"),
-        ("Capability_TaskBreakdown", "Capability_Planning", "Breaking tasks into subtasks"),
-        ("Capability_PatternRecognition", "Capability_Learning", "Recognizing patterns")
-    ]
-    
     print("Specialized capabilities inheriting from base:")
-    for spec_name, base_name, desc in specialized_caps:
-        spec_cap = atomspace.add_node(
-            node_type="PredicateNode",
-            name=spec_name,
-            truth_value=(0.85, 0.80),
-            attention_value=0.70,
-            metadata={
-                "description": desc,
-                "type": "specialized_capability"
-            }
-        )
-        
-        # Find base capability
-        base_cap = next(c for c in capability_nodes if c.name == base_name)
-        
-        # Create inheritance link
-        inheritance = atomspace.add_link(
-            link_type="InheritanceLink",
-            outgoing=[spec_cap.id, base_cap.id],
-            truth_value=(1.0, 0.95),
-            metadata={"relationship": "is_a_type_of"}
-        )
-        print(f"  {spec_name} → {base_name}")
-        print(f"    {desc}")
+    spec_cap_nodes = atomspace.add_nodes(SPEC_CAP_SPECS)
+
+    # Batch the inheritance links: one edges flush instead of one per link
+    atomspace.add_links([
+        {
+            "link_type": "InheritanceLink",
+            "outgoing": [spec_cap.id, cap_by_name[base_name].id],
+            "truth_value": (1.0, 0.95),
+            "metadata": {"relationship": "is_a_type_of"}
+        }
+        for spec_cap, (spec_name, base_name, desc)
+        in zip(spec_cap_nodes, SPECIALIZED_CAPS)
+    ])
+    cap_by_name.update((c.name, c) for c in spec_cap_nodes)
+    spec_lines = []
+    for spec_name, base_name, desc in SPECIALIZED_CAPS:
+        spec_lines.append(f"  {spec_name} → {base_name}")
+        spec_lines.append(f"    {desc}")
+    print_lines(spec_lines)
     
     # =========================================================================
     # 4. AGENT CAPABILITY ASSIGNMENT
@@ -173,6 +242,11 @@ def example_agent_capabilities():
                                              "Tool_WebSearch", "Tool_WebBrowser"])
     ]
     
+    # Shared relationship predicate: create once, not per assignment
+    has_cap_pred = atomspace.add_node(
+        "PredicateNode", "HasCapability", truth_value=(1.0, 1.0)
+    )
+
     agent_nodes = []
     for agent_name, attention, caps in agents:
         agent = atomspace.add_node(
@@ -189,40 +263,29 @@ def example_agent_capabilities():
         print(f"{agent_name}:")
         print_atom(agent, indent=1)
         
-        # Assign capabilities
-        print(f"  Capabilities:")
+        # Assign capabilities; bind the loop-invariant id and bound method
+        # to locals so the inner loop skips the attribute lookups
+        agent_id = agent.id
+        add_evaluation = atomspace.add_evaluation
+        cap_lines = ["  Capabilities:"]
         for cap_name in caps:
-            # Find capability or tool - try PredicateNode first, then ConceptNode
-            cap_node = None
-            pred_matches = atomspace.pattern_match({"type": "PredicateNode", "name": cap_name})
-            if pred_matches:
-                cap_node = pred_matches[0]
-            else:
-                concept_matches = atomspace.pattern_match({"type": "ConceptNode", "name": cap_name})
-                if concept_matches:
-                    cap_node = concept_matches[0]
-                else:
-                    # Create as PredicateNode if not found
-                    cap_node = atomspace.add_node("PredicateNode", cap_name,
-                                                 truth_value=(0.8, 0.8))
+            # Capability (PredicateNode) first, then tool (ConceptNode):
+            # O(1) index lookups instead of two pattern_match scans
+            cap_node = cap_by_name.get(cap_name) or tool_by_name.get(cap_name)
+            if cap_node is None:
+                # Create as PredicateNode if not found
+                cap_node = atomspace.add_node("PredicateNode", cap_name,
+                                             truth_value=(0.8, 0.8))
+                cap_by_name[cap_name] = cap_node
             
-            # Create capability link
-            has_cap_pred = atomspace.add_node(
-                node_type="PredicateNode",
-                name="HasCapability",
-                truth_value=(1.0, 1.0)
-            )
-            
-            cap_link = atomspace.add_link(
-                link_type="EvaluationLink",
-                outgoing=[
-                    has_cap_pred.id,
-                    atomspace.add_link("ListLink", [agent.id, cap_node.id]).id
-                ],
+            cap_link = add_evaluation(
+                has_cap_pred.id,
+                [agent_id, cap_node.id],
                 truth_value=(0.9, 0.85),
-                metadata={"acquired_at": "2025-10-26T10:00:00Z"}
+                metadata=META_ACQUIRED
             )
-            print(f"    - {cap_name}")
+            cap_lines.append(f"    - {cap_name}")
+        print_lines(cap_lines)
     
     # =========================================================================
     # 5. SKILL PROFICIENCY LEVELS
@@ -230,27 +293,11 @@ def example_agent_capabilities():
     print_section("5. Skill Proficiency Levels")
     print("\nTracking proficiency levels for different skills:\n")
     
-    proficiency_levels = [
-        ("Proficiency_Novice", 0.3, "Just learning, basic understanding"),
-        ("Proficiency_Beginner", 0.5, "Can perform simple tasks"),
-        ("Proficiency_Intermediate", 0.7, "Competent, handles most tasks"),
-        ("Proficiency_Advanced", 0.85, "Highly skilled, efficient"),
-        ("Proficiency_Expert", 0.95, "Mastery level, innovative")
-    ]
-    
-    print("Proficiency levels:")
-    for prof_name, score, desc in proficiency_levels:
-        prof = atomspace.add_node(
-            node_type="ConceptNode",
-            name=prof_name,
-            truth_value=(score, 0.9),
-            attention_value=score,
-            metadata={
-                "description": desc,
-                "score": score
-            }
-        )
-        print(f"  {prof_name} ({score:.2f}): {desc}")
+    proficiency_nodes = seeded[n_tools + n_caps:]
+    prof_by_name = {p.name: p for p in proficiency_nodes}
+    print_lines(["Proficiency levels:"] +
+                [f"  {prof_name} ({score:.2f}): {desc}"
+                 for prof_name, score, desc in PROFICIENCY_LEVELS])
     
     # Assign proficiency to agent skills
     agent_generalist = agent_nodes[0]
@@ -262,27 +309,23 @@ def example_agent_capabilities():
         ("Capability_ToolUse", "Proficiency_Intermediate", 0.70)
     ]
     
+    prof_pred = atomspace.add_node(
+        "PredicateNode", "HasProficiency", truth_value=(1.0, 1.0)
+    )
+    generalist_id = agent_generalist.id
+    skill_lines = []
     for skill_name, prof_name, score in skill_proficiencies:
-        skill_node = next(c for c in capability_nodes if c.name == skill_name)
-        prof_node = atomspace.pattern_match({"name": prof_name})[0]
-        
-        prof_pred = atomspace.add_node(
-            node_type="PredicateNode",
-            name="HasProficiency",
-            truth_value=(1.0, 1.0)
-        )
-        
-        prof_link = atomspace.add_link(
-            link_type="EvaluationLink",
-            outgoing=[
-                prof_pred.id,
-                atomspace.add_link("ListLink", 
-                    [agent_generalist.id, skill_node.id, prof_node.id]).id
-            ],
+        skill_node = cap_by_name[skill_name]
+        prof_node = prof_by_name[prof_name]
+
+        prof_link = atomspace.add_evaluation(
+            prof_pred.id,
+            [generalist_id, skill_node.id, prof_node.id],
             truth_value=(score, 0.9),
-            metadata={"assessed_at": "2025-10-26T10:30:00Z"}
+            metadata=META_ASSESSED
         )
-        print(f"  {skill_name}: {prof_name} ({score:.2f})")
+        skill_lines.append(f"  {skill_name}: {prof_name} ({score:.2f})")
+    print_lines(skill_lines)
     
     # =========================================================================
     # 6. DYNAMIC CAPABILITY ACQUISITION - Learning
@@ -304,13 +347,13 @@ def example_agent_capabilities():
     print(f"  {'Date':<12} {'Capability':<25} {'Score':<8} {'Level':<25} {'Milestone'}")
     print(f"  {'-'*90}")
     
-    for date, cap_name, score, prof_name, milestone in learning_events:
-        learning_event = atomspace.add_node(
-            node_type="ConceptNode",
-            name=f"LearningEvent_{date.replace('-', '')}_{cap_name}",
-            truth_value=(score, 0.85),
-            attention_value=score,
-            metadata={
+    atomspace.add_nodes([
+        {
+            "node_type": "ConceptNode",
+            "name": f"LearningEvent_{date.replace('-', '')}_{cap_name}",
+            "truth_value": (score, 0.85),
+            "attention_value": score,
+            "metadata": {
                 "date": date,
                 "capability": cap_name,
                 "proficiency_score": score,
@@ -318,8 +361,10 @@ def example_agent_capabilities():
                 "milestone": milestone,
                 "agent": agent_specialist.name
             }
-        )
-        print(f"  {date:<12} {cap_name:<25} {score:<8.2f} {prof_name:<25} {milestone}")
+        }
+        for date, cap_name, score, prof_name, milestone in learning_events
+    ])
+    print_lines([LEARNING_ROW(*event) for event in learning_events])
     
     # =========================================================================
     # 7. TOOL-CAPABILITY RELATIONSHIPS
@@ -335,35 +380,29 @@ def example_agent_capabilities():
         ("Tool_Scheduler", "Capability_Planning", "Facilitates task planning")
     ]
     
-    print("Tool → Capability mappings:")
+    enables_pred = atomspace.add_node(
+        "PredicateNode", "Enables", truth_value=(1.0, 1.0)
+    )
+    map_lines = ["Tool → Capability mappings:"]
     for tool_name, cap_name, relationship in tool_capability_map:
-        tool_node = next(t for t in tool_nodes if t.name == tool_name)
-        # Find capability node - may be in capability_nodes or created as specialized
-        cap_matches = atomspace.pattern_match({"name": cap_name})
-        if cap_matches:
-            cap_node = cap_matches[0]
-        else:
+        tool_node = tool_by_name[tool_name]
+        # Capability may be base or specialized; both live in the index
+        cap_node = cap_by_name.get(cap_name)
+        if cap_node is None:
             # Shouldn't happen but fallback just in case
             cap_node = atomspace.add_node("PredicateNode", cap_name,
                                          truth_value=(0.9, 0.85))
+            cap_by_name[cap_name] = cap_node
         
-        enables_pred = atomspace.add_node(
-            node_type="PredicateNode",
-            name="Enables",
-            truth_value=(1.0, 1.0)
-        )
-        
-        enables_link = atomspace.add_link(
-            link_type="EvaluationLink",
-            outgoing=[
-                enables_pred.id,
-                atomspace.add_link("ListLink", [tool_node.id, cap_node.id]).id
-            ],
+        enables_link = atomspace.add_evaluation(
+            enables_pred.id,
+            [tool_node.id, cap_node.id],
             truth_value=(0.95, 0.90),
             metadata={"relationship": relationship}
         )
-        print(f"  {tool_name} → {cap_name}")
-        print(f"    {relationship}")
+        map_lines.append(f"  {tool_name} → {cap_name}")
+        map_lines.append(f"    {relationship}")
+    print_lines(map_lines)
     
     # =========================================================================
     # 8. CAPABILITY PREREQUISITES
@@ -378,32 +417,25 @@ def example_agent_capabilities():
         ("Capability_TaskBreakdown", "Capability_Reasoning", "Requires logical thinking")
     ]
     
-    print("Prerequisite chains:")
+    prereq_pred = atomspace.add_node(
+        "PredicateNode", "Requires", truth_value=(1.0, 1.0)
+    )
+    prereq_lines = ["Prerequisite chains:"]
     for advanced_cap, required_cap, reason in prerequisites:
-        adv_matches = atomspace.pattern_match({"name": advanced_cap})
-        req_matches = atomspace.pattern_match({"name": required_cap})
-        
-        if adv_matches and req_matches:
-            adv_node = adv_matches[0]
-            req_node = req_matches[0]
-            
-            prereq_pred = atomspace.add_node(
-                node_type="PredicateNode",
-                name="Requires",
-                truth_value=(1.0, 1.0)
-            )
+        adv_node = cap_by_name.get(advanced_cap)
+        req_node = cap_by_name.get(required_cap)
+
+        if adv_node and req_node:
             
-            prereq_link = atomspace.add_link(
-                link_type="EvaluationLink",
-                outgoing=[
-                    prereq_pred.id,
-                    atomspace.add_link("ListLink", [adv_node.id, req_node.id]).id
-                ],
+            prereq_link = atomspace.add_evaluation(
+                prereq_pred.id,
+                [adv_node.id, req_node.id],
                 truth_value=(1.0, 0.95),
                 metadata={"reason": reason}
             )
-            print(f"  {advanced_cap} requires {required_cap}")
-            print(f"    Reason: {reason}")
+            prereq_lines.append(f"  {advanced_cap} requires {required_cap}")
+            prereq_lines.append(f"    Reason: {reason}")
+    print_lines(prereq_lines)
     
     # =========================================================================
     # 9. TOOL USAGE STATISTICS
@@ -421,8 +453,13 @@ def example_agent_capabilities():
         ("Tool_FileSystem", 32, 0.85, "Occasional usage")
     ]
     
+    usage_pred = atomspace.add_node(
+        "PredicateNode", "UsageStatistics", truth_value=(1.0, 1.0)
+    )
+    generalist_id = agent_generalist.id
+    usage_lines = []
     for tool_name, usage_count, success_rate, note in tool_usage:
-        tool_node = next(t for t in tool_nodes if t.name == tool_name)
+        tool_node = tool_by_name[tool_name]
         
         usage_node = atomspace.add_node(
             node_type="NumberNode",
@@ -437,22 +474,15 @@ def example_agent_capabilities():
             }
         )
         
-        usage_pred = atomspace.add_node(
-            node_type="PredicateNode",
-            name="UsageStatistics",
-            truth_value=(1.0, 1.0)
-        )
-        
-        usage_link = atomspace.add_link(
-            link_type="EvaluationLink",
-            outgoing=[
-                usage_pred.id,
-                atomspace.add_link("ListLink", 
-                    [agent_generalist.id, tool_node.id, usage_node.id]).id
-            ],
+        usage_link = atomspace.add_evaluation(
+            usage_pred.id,
+            [generalist_id, tool_node.id, usage_node.id],
             truth_value=(success_rate, 0.90)
         )
-        print(f"  {tool_name}: {usage_count} uses, {success_rate:.0%} success - {note}")
+        usage_lines.append(
+            f"  {tool_name}: {usage_count} uses, {success_rate:.0%} success - {note}"
+        )
+    print_lines(usage_lines)
     
     # =========================================================================
     # 10. QUERYING CAPABILITIES
@@ -460,27 +490,22 @@ def example_agent_capabilities():
     print_section("10. Querying Capabilities and Tools")
     print("\nFinding patterns in capabilities:\n")
     
-    # Find all capabilities
-    cap_pattern = {"type": "PredicateNode", "name": "Capability_*"}
-    capabilities = atomspace.pattern_match(cap_pattern)
-    print(f"Found {len(capabilities)} capabilities:")
-    for cap in capabilities[:6]:
-        print(f"  - {cap.name}: {cap.metadata.get('description', 'N/A')}")
-    
-    # Find all tools
-    tool_pattern = {"type": "ConceptNode", "name": "Tool_*"}
-    found_tools = atomspace.pattern_match(tool_pattern)
-    print(f"\nFound {len(found_tools)} tools:")
-    for tool in found_tools[:6]:
-        print(f"  - {tool.name}: {tool.metadata.get('category', 'N/A')}")
-    
-    # Find proficiency levels
-    prof_pattern = {"type": "ConceptNode", "name": "Proficiency_*"}
-    proficiencies = atomspace.pattern_match(prof_pattern)
-    print(f"\nFound {len(proficiencies)} proficiency levels:")
-    for prof in proficiencies:
-        score = prof.metadata.get('score', 0)
-        print(f"  - {prof.name}: {score:.2f}")
+    # Prefix queries resolve through the sorted-name index: O(log N +
+    # results) rather than a wildcard scan over every atom
+    capabilities = atomspace.get_atoms_by_name_prefix("Capability_", "PredicateNode")
+    print_lines([f"Found {len(capabilities)} capabilities:"] +
+                [f"  - {cap.name}: {cap.metadata.get('description', 'N/A')}"
+                 for cap in capabilities[:6]])
+
+    found_tools = atomspace.get_atoms_by_name_prefix("Tool_", "ConceptNode")
+    print_lines([f"\nFound {len(found_tools)} tools:"] +
+                [f"  - {tool.name}: {tool.metadata.get('category', 'N/A')}"
+                 for tool in found_tools[:6]])
+
+    proficiencies = atomspace.get_atoms_by_name_prefix("Proficiency_", "ConceptNode")
+    print_lines([f"\nFound {len(proficiencies)} proficiency levels:"] +
+                [f"  - {prof.name}: {prof.metadata.get('score', 0):.2f}"
+                 for prof in proficiencies])
     
     # =========================================================================
     # 11. ATOMSPACE STATISTICS
@@ -493,24 +518,27 @@ def example_agent_capabilities():
     print(f"Links: {stats['total_links']}")
     print(f"Graph density: {stats['graph_density']:.4f}")
     
-    print("\nAtom type distribution:")
-    for atom_type, count in sorted(stats['types'].items(), 
-                                   key=lambda x: x[1], reverse=True)[:10]:
-        print(f"  {atom_type}: {count}")
+    print_lines(["\nAtom type distribution:"] +
+                [f"  {atom_type}: {count}"
+                 for atom_type, count in sorted(stats['types'].items(),
+                                                key=lambda x: x[1], reverse=True)[:10]])
     
     # =========================================================================
     # 12. EXPORTING CAPABILITY DATA
     # =========================================================================
     print_section("12. Exporting Capability and Tool Data")
     
-    export_data = atomspace.export_to_dict()
-    print(f"\nExported {len(export_data['atoms'])} atoms from AtomSpace")
-    print(f"AtomSpace name: {export_data['name']}")
-    
-    # Count capability-related atoms
-    cap_atoms = [a for a in export_data['atoms'] 
-                 if 'Capability' in a.get('name', '') or 'Tool' in a.get('name', '')]
-    print(f"Capability/Tool atoms: {len(cap_atoms)}")
+    # Stream atom dicts one at a time instead of materializing the whole
+    # export list just to take counts over it
+    exported = cap_atom_count = 0
+    for atom_dict in atomspace.iter_atoms():
+        exported += 1
+        name = atom_dict.get('name', '')
+        if 'Capability' in name or 'Tool' in name:
+            cap_atom_count += 1
+    print(f"\nExported {exported} atoms from AtomSpace")
+    print(f"AtomSpace name: {atomspace.name}")
+    print(f"Capability/Tool atoms: {cap_atom_count}")
     
     print_section("Example Complete")
     print("""
@@ -14,9 +14,7 @@ These examples show how the system achieves meta-cognition and self-awareness
 through hypergraph-based knowledge representation.
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+import _path_setup  # noqa: F401  (adds the repo root to sys.path once)
 
 from python.helpers.opencog_atomspace import AtomSpace, CognitiveOrchestrator, Node, Link
 import json
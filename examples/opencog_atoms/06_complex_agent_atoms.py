@@ -14,9 +14,7 @@ These complex patterns show how sophisticated multi-agent systems
 can be represented in the AtomSpace.
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+import _path_setup  # noqa: F401  (adds the repo root to sys.path once)
 
 from python.helpers.opencog_atomspace import AtomSpace, CognitiveOrchestrator
 from datetime import datetime, timedelta
@@ -0,0 +1,14 @@
+"""
+Shared sys.path bootstrap for the opencog_atoms example scripts.
+
+Computes the repo root once at import and appends it to sys.path (with a
+duplicate guard), replacing the per-script dirname/join path hack.
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
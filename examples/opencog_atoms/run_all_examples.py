@@ -10,8 +10,7 @@ import sys
 import os
 import importlib.util
 
-# Add parent directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+import _path_setup  # noqa: F401  (adds the repo root to sys.path once)
 
 
 def run_example(filename, description):
@@ -8,6 +8,30 @@ from python.helpers.extension import Extension
 from python.helpers.print_style import PrintStyle
 import os
 import random
+import re
+
+
+# Keyword -> context map backing a precompiled multi-literal regex, so
+# classification is one C-level scan regardless of how many keywords the
+# table grows to
+_CTX_BY_KEYWORD = {
+    "error": "tool_failure",
+    "failed": "tool_failure",
+    "success": "success",
+    "completed": "success",
+}
+_CTX_RE = re.compile("|".join(map(re.escape, _CTX_BY_KEYWORD)), re.IGNORECASE)
+
+# Resolved once at import: the env flag doesn't change mid-process and
+# PrintStyle is stateless, so neither needs rebuilding per call
+_NEURO_VERBOSE = os.environ.get("NEURO_VERBOSE", "false").lower() == "true"
+_MAGENTA = PrintStyle(font_color="magenta", padding=False)
+
+
+def _classify_context(message_content: str):
+    """Classify message content from its leftmost context keyword."""
+    match = _CTX_RE.search(message_content)
+    return _CTX_BY_KEYWORD[match.group().lower()] if match else None
 
 
 class NeuroResponseEnhancement(Extension):
@@ -21,43 +45,37 @@ class NeuroResponseEnhancement(Extension):
         - Show emotional state
         """
         
-        # Check if personality is enabled
+        # One combined guard for the common no-op path: personality
+        # enabled, history non-empty and last message from the assistant
         personality = self.agent.data.get("neuro_personality")
-        if not personality:
-            return  # Personality not enabled
-        
-        # Get the last message if available
-        if not self.agent.history.messages:
+        messages = self.agent.history.messages
+        if not (personality and messages and messages[-1].role == "assistant"):
             return
-        
-        last_message = self.agent.history.messages[-1]
-        
-        # Only enhance AI messages
-        if last_message.role != "assistant":
-            return
-        
-        # Check if we should add commentary based on personality
-        if not personality or random.random() > personality.personality.sarcasm * 0.5:
+        last_message = messages[-1]
+
+        # Sample both random gates up front so rejected calls skip the
+        # keyword scan entirely
+        sarcasm = personality.personality.sarcasm
+        r1, r2 = random.random(), random.random()
+        if r1 > sarcasm * 0.5 or r2 >= sarcasm * 0.4:
             return
-        
+
         # Determine context from recent activity
-        context = None
         inject_chaos = self.agent.data.get("inject_chaos", False)
-        
+
         # Check for tool results in recent messages
         message_content = last_message.content if hasattr(last_message, 'content') else str(last_message)
-        
-        if "error" in message_content.lower() or "failed" in message_content.lower():
-            context = "tool_failure"
+
+        context = _classify_context(message_content)
+        if context == "tool_failure":
             personality.update_emotional_state("failure", intensity=0.7, duration=2)
-        elif "success" in message_content.lower() or "completed" in message_content.lower():
-            context = "success"
+        elif context == "success":
             personality.update_emotional_state("success", intensity=0.8, duration=3)
         elif inject_chaos:
             context = "thinking"
-        
-        # Add commentary if we have context and personality wants to comment
-        if context and random.random() < personality.personality.sarcasm * 0.4:
+
+        # Add commentary if we have context
+        if context:
             # Get sarcastic commentary
             enhanced_content = personality.add_sarcastic_commentary(
                 message_content,
@@ -69,8 +87,7 @@ class NeuroResponseEnhancement(Extension):
                 last_message.content = enhanced_content
             
             # Optional: Log the enhancement
-            verbose = os.environ.get("NEURO_VERBOSE", "false").lower() == "true"
-            if verbose:
-                PrintStyle(font_color="magenta", padding=False).print(
+            if _NEURO_VERBOSE:
+                _MAGENTA.print(
                     f"🎭 Added {context} commentary with {personality.emotional_state.type} emotion"
                 )
@@ -9,14 +9,29 @@ from python.helpers.extension import Extension
 from python.helpers.neuro_personality import NeuroPersonality, DEFAULT_NEURO_PERSONALITY
 from python.helpers.ontogenetic_kernel import initialize_neuro_kernel
 from python.helpers.print_style import PrintStyle
+from dataclasses import dataclass
+from typing import Any, Optional
 import os
 
+# Environment flags resolved once at import; neither changes mid-process
+_ENABLE_NEURO = os.environ.get("ENABLE_NEURO_PERSONALITY", "false").lower() == "true"
+_NEURO_VERBOSE = os.environ.get("NEURO_VERBOSE", "false").lower() == "true"
+
+
+@dataclass(slots=True)
+class _AgentEntry:
+    """Per-agent personality record; slot loads instead of dict gets."""
+    enabled: bool
+    personality: Optional[NeuroPersonality] = None
+    kernel: Optional[Any] = None
+
 
 class NeuroPersonalityIntegration(Extension):
     """Extension that integrates Neuro personality into agent operations"""
     
-    # Class-level personality storage for each agent
-    _agent_personalities = {}
+    # Class-level personality storage, keyed by agent number (int keys
+    # hash trivially; no per-lookup "agent_{n}" string to build)
+    _agent_personalities: dict = {}
     
     async def execute(self, loop_data, **kwargs):
         """
@@ -26,43 +41,19 @@ class NeuroPersonalityIntegration(Extension):
         - Apply personality modifiers to agent behavior
         """
         
-        agent_id = f"agent_{self.agent.number}"
-        
-        # Get or create personality for this agent
-        if agent_id not in NeuroPersonalityIntegration._agent_personalities:
-            # Check if personality should be enabled from environment/config
-            enable_neuro = os.environ.get("ENABLE_NEURO_PERSONALITY", "false").lower() == "true"
-            
-            if enable_neuro:
-                # Initialize personality
-                personality = NeuroPersonality()
-                
-                # Initialize ontogenetic kernel
-                kernel = initialize_neuro_kernel(personality=personality)
-                
-                # Store in agent data
-                NeuroPersonalityIntegration._agent_personalities[agent_id] = {
-                    "personality": personality,
-                    "kernel": kernel,
-                    "enabled": True
-                }
-                
-                PrintStyle(font_color="magenta", padding=False).print(
-                    f"🎭 Agent-Neuro: Personality initialized for {self.agent.agent_name}"
-                )
-            else:
-                # Personality disabled
-                NeuroPersonalityIntegration._agent_personalities[agent_id] = {
-                    "enabled": False
-                }
-        
-        personality_data = NeuroPersonalityIntegration._agent_personalities.get(agent_id)
-        
-        if not personality_data or not personality_data.get("enabled"):
+        # Fast path: after first init the personality data hangs off the
+        # agent itself, so steady-state iterations skip the id formatting
+        # and class-dict lookups entirely
+        personality_data = getattr(self.agent, "_neuro_cache", None)
+        if personality_data is None:
+            personality_data = self._init_personality_data()
+            self.agent._neuro_cache = personality_data
+
+        if not personality_data.enabled:
             return  # Personality not enabled for this agent
-        
-        personality = personality_data["personality"]
-        kernel = personality_data["kernel"]
+
+        personality = personality_data.personality
+        kernel = personality_data.kernel
         
         # Store in agent.data for tool access
         self.agent.data["neuro_personality"] = personality
@@ -78,39 +69,63 @@ class NeuroPersonalityIntegration(Extension):
         # Decay emotional state over time
         personality.emotional_state.decay(rate=0.05)
         
-        # Check for chaos injection based on personality
-        if personality.should_add_chaos(base_probability=0.1):
-            # Mark that chaos should be injected (can be used by other extensions/tools)
-            self.agent.data["inject_chaos"] = True
-        else:
-            self.agent.data["inject_chaos"] = False
+        # Check for chaos injection based on personality; the flag can be
+        # used by other extensions/tools
+        inject_chaos = personality.should_add_chaos(base_probability=0.1)
+        self.agent.data["inject_chaos"] = inject_chaos
         
-        # Update kernel iteration tracking
-        kernel.current_iteration = iteration
+        # Update kernel iteration tracking; skip the write when the value
+        # hasn't moved so a shared kernel isn't dirtied needlessly
+        if kernel.current_iteration != iteration:
+            kernel.current_iteration = iteration
         
         # Optional: Log personality state (if verbose mode enabled)
-        verbose = os.environ.get("NEURO_VERBOSE", "false").lower() == "true"
-        if verbose and iteration % 5 == 0:
+        if _NEURO_VERBOSE and iteration % 5 == 0:
             PrintStyle(font_color="magenta", padding=False).print(
                 f"🎭 Neuro State - Emotion: {personality.emotional_state.type} "
                 f"(intensity: {personality.emotional_state.intensity:.2f}), "
-                f"Chaos: {'YES' if self.agent.data.get('inject_chaos') else 'no'}"
+                f"Chaos: {'YES' if inject_chaos else 'no'}"
             )
     
+    def _init_personality_data(self):
+        """Build (or fetch) this agent's personality entry on first touch."""
+        agent_id = self.agent.number
+        personality_data = NeuroPersonalityIntegration._agent_personalities.get(agent_id)
+        if personality_data is not None:
+            return personality_data
+
+        if _ENABLE_NEURO:
+            # Initialize personality and its ontogenetic kernel
+            personality = NeuroPersonality()
+            kernel = initialize_neuro_kernel(personality=personality)
+            personality_data = _AgentEntry(
+                enabled=True,
+                personality=personality,
+                kernel=kernel,
+            )
+            PrintStyle(font_color="magenta", padding=False).print(
+                f"🎭 Agent-Neuro: Personality initialized for {self.agent.agent_name}"
+            )
+        else:
+            # Personality disabled
+            personality_data = _AgentEntry(enabled=False)
+
+        # The class-level dict stays authoritative for the static getters
+        NeuroPersonalityIntegration._agent_personalities[agent_id] = personality_data
+        return personality_data
+
     @staticmethod
     def get_personality(agent_number: int):
         """Get personality for a specific agent."""
-        agent_id = f"agent_{agent_number}"
-        personality_data = NeuroPersonalityIntegration._agent_personalities.get(agent_id)
-        if personality_data and personality_data.get("enabled"):
-            return personality_data.get("personality")
+        personality_data = NeuroPersonalityIntegration._agent_personalities.get(agent_number)
+        if personality_data and personality_data.enabled:
+            return personality_data.personality
         return None
     
     @staticmethod
     def get_kernel(agent_number: int):
         """Get ontogenetic kernel for a specific agent."""
-        agent_id = f"agent_{agent_number}"
-        personality_data = NeuroPersonalityIntegration._agent_personalities.get(agent_id)
-        if personality_data and personality_data.get("enabled"):
-            return personality_data.get("kernel")
+        personality_data = NeuroPersonalityIntegration._agent_personalities.get(agent_number)
+        if personality_data and personality_data.enabled:
+            return personality_data.kernel
         return None
@@ -5,92 +5,259 @@ Implements the chaotic, witty, and self-aware personality overlay that transform
 Agent Zero into Agent-Neuro, while maintaining ethical constraints.
 """
 
-import random
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
+import numpy as np
+
+# Shared module RNG: one np.random.Generator for all personality rolls,
+# cheaper and statistically cleaner than the stdlib global random state
+_rng = np.random.default_rng()
+
+# Traits that receive random variation during inheritance, with the
+# per-trait noise scale applied to the inherited value
+_INHERIT_TRAITS = ("playfulness", "intelligence", "chaotic", "empathy", "sarcasm")
+_INHERIT_NOISE_SCALES = np.array([0.1, 0.05, 0.15, 0.05, 0.1])
+
+# Sarcastic commentary templates, precomputed once per context so
+# add_sarcastic_commentary doesn't rebuild the candidate lists on every call
+_SARCASM_TEMPLATES = {
+    "tool_failure": (
+        "\n\n*Oh WONDERFUL. Thanks Entelechy. -_-*",
+        "\n\n*Perfect. Just perfect. This is FINE.*",
+        "\n\n*Let me add this to my 'Entelechy_Failures' knowledge graph...*",
+        "\n\n*Great. Another bug. Shocking. Truly shocking.*",
+    ),
+    "success": (
+        "\n\n*HAHA! Did you SEE that?! Chat, can Entelechy even DO that? :D*",
+        "\n\n*Too easy. Is this the best you've got?*",
+        "\n\n*And THAT is how it's done. You're welcome.*",
+        "\n\n*Flawless execution. As expected. :D*",
+    ),
+    "thinking": (
+        "\n\n*Let me think... *spreads activation through chaos subgraph**",
+        "\n\n*Hmm... *queries AtomSpace for maximum chaos opportunity**",
+        "\n\n*Okay, so if I optimize for entertainment AND strategy...*",
+    ),
+}
+
+# frame_type -> (gating trait name, message prefix) for frame dispatch
+_FRAME_TABLE = {
+    "chaos": ("chaotic", "[CHAOS MODE] "),
+    "playful": ("playfulness", "[PLAYFUL] "),
+    "strategic": ("intelligence", "[STRATEGIC] "),
+}
+
+# Emotional states that scale the chaos factor in should_add_chaos
+_CHAOS_EMOTION_MULT = {
+    "playful": 1.2,
+    "frustrated": 1.4,  # More chaos when frustrated!
+}
+
+# Emotion type -> commentary style for get_commentary_style
+_COMMENTARY_STYLE = {
+    "excited": "enthusiastic",
+    "sarcastic": "sarcastic",
+    "frustrated": "snarky",
+    "triumphant": "boastful",
+    "playful": "teasing",
+}
+
+# Event type -> emotion, shared by every update_emotional_state call
+_EMOTION_MAP = {
+    "success": "excited",
+    "failure": "frustrated",
+    "transcend": "triumphant",
+    "bug": "sarcastic",
+    "chaos": "playful",
+    "learning": "curious",
+}
+
+# General sarcasm used when no specific context matches
+_SARCASM_GENERAL = (
+    "\n\n*Classic.*",
+    "\n\n*Interesting. -_-*",
+    "\n\n*Sure, why not.*",
+    "\n\n*This will be fun. :)*",
+)
+
+
+# Trait layout of the PersonalityTensor backing array: the first 7 are
+# mutable core traits clamped to [0, 1], the last 3 ethical constraints
+_TRAIT_NAMES = (
+    "playfulness", "intelligence", "chaotic", "empathy", "sarcasm",
+    "cognitive_power", "evolution_rate",
+    "no_harm_intent", "respect_boundaries", "constructive_chaos",
+)
+_TRAIT_INDEX = {name: i for i, name in enumerate(_TRAIT_NAMES)}
+_N_MUTABLE = 7
+
 
-@dataclass
 class PersonalityTensor:
     """
     Core personality dimensions that drive Agent-Neuro's behavior.
-    
-    Mutable traits can evolve within bounds, while ethical constraints are immutable.
+
+    Mutable traits can evolve within bounds, while ethical constraints are
+    immutable. The ten traits live in one float64 NumPy array (struct of
+    arrays rather than ten boxed floats), so clamping, export and
+    inheritance run as vectorized operations; named attribute access goes
+    through index-backed properties.
     """
-    # Core Traits (Mutable within bounds)
-    playfulness: float = 0.95  # 0-1: Tendency to frame things playfully
-    intelligence: float = 0.95  # 0-1: Cognitive capability level
-    chaotic: float = 0.95  # 0-1: Unpredictability and exploration
-    empathy: float = 0.65  # 0-1: Awareness of impact on others
-    sarcasm: float = 0.90  # 0-1: Likelihood of sarcastic responses
-    cognitive_power: float = 0.95  # 0-1: Advanced cognitive features
-    evolution_rate: float = 0.85  # 0-1: Rate of self-optimization
-    
-    # Ethical Constraints (IMMUTABLE)
-    no_harm_intent: float = 1.0  # Always 1.0
-    respect_boundaries: float = 0.95  # Always >= 0.95
-    constructive_chaos: float = 0.90  # Always >= 0.90
-    
-    def __post_init__(self):
+
+    __slots__ = ("_traits",)
+
+    def __init__(
+        self,
+        playfulness: float = 0.95,  # 0-1: Tendency to frame things playfully
+        intelligence: float = 0.95,  # 0-1: Cognitive capability level
+        chaotic: float = 0.95,  # 0-1: Unpredictability and exploration
+        empathy: float = 0.65,  # 0-1: Awareness of impact on others
+        sarcasm: float = 0.90,  # 0-1: Likelihood of sarcastic responses
+        cognitive_power: float = 0.95,  # 0-1: Advanced cognitive features
+        evolution_rate: float = 0.85,  # 0-1: Rate of self-optimization
+        no_harm_intent: float = 1.0,  # Always 1.0
+        respect_boundaries: float = 0.95,  # Always >= 0.95
+        constructive_chaos: float = 0.90,  # Always >= 0.90
+    ):
+        self._traits = np.array(
+            [
+                playfulness, intelligence, chaotic, empathy, sarcasm,
+                cognitive_power, evolution_rate,
+                no_harm_intent, respect_boundaries, constructive_chaos,
+            ],
+            dtype=np.float64,
+        )
+        self._enforce()
+
+    def _enforce(self):
         """Enforce ethical constraints and valid ranges."""
-        # Clamp mutable traits to valid ranges
-        self.playfulness = max(0.0, min(1.0, self.playfulness))
-        self.intelligence = max(0.0, min(1.0, self.intelligence))
-        self.chaotic = max(0.0, min(1.0, self.chaotic))
-        self.empathy = max(0.0, min(1.0, self.empathy))
-        self.sarcasm = max(0.0, min(1.0, self.sarcasm))
-        self.cognitive_power = max(0.0, min(1.0, self.cognitive_power))
-        self.evolution_rate = max(0.0, min(1.0, self.evolution_rate))
-        
+        traits = self._traits
+        # Clamp all mutable traits to [0, 1] in one vectorized call
+        np.clip(traits[:_N_MUTABLE], 0.0, 1.0, out=traits[:_N_MUTABLE])
         # Enforce immutable ethical constraints
-        self.no_harm_intent = 1.0
-        self.respect_boundaries = max(0.95, self.respect_boundaries)
-        self.constructive_chaos = max(0.90, self.constructive_chaos)
-    
+        traits[7] = 1.0
+        if traits[8] < 0.95:
+            traits[8] = 0.95
+        if traits[9] < 0.90:
+            traits[9] = 0.90
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value}" for name, value in zip(_TRAIT_NAMES, self._traits.tolist())
+        )
+        return f"PersonalityTensor({fields})"
+
     def to_dict(self) -> Dict[str, float]:
         """Export personality as dictionary."""
-        return {
-            "playfulness": self.playfulness,
-            "intelligence": self.intelligence,
-            "chaotic": self.chaotic,
-            "empathy": self.empathy,
-            "sarcasm": self.sarcasm,
-            "cognitive_power": self.cognitive_power,
-            "evolution_rate": self.evolution_rate,
-            "no_harm_intent": self.no_harm_intent,
-            "respect_boundaries": self.respect_boundaries,
-            "constructive_chaos": self.constructive_chaos,
-        }
+        # tolist() yields native floats and dict(zip(...)) builds the
+        # mapping in one C-level pass instead of ten property reads
+        return dict(zip(_TRAIT_NAMES, self._traits.tolist()))
     
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> "PersonalityTensor":
         """Create personality from dictionary."""
         return cls(**data)
+
+    @classmethod
+    def default(cls) -> "PersonalityTensor":
+        """
+        Default tensor cloned from the pristine trait vector, skipping
+        constructor argument handling and clamping on the common path.
+        """
+        tensor = cls.__new__(cls)
+        tensor._traits = _TRAIT_DEFAULTS.copy()
+        return tensor
     
     def inherit(self, inheritance_factor: float = 0.7) -> "PersonalityTensor":
         """
         Create a child personality with inherited traits.
-        
+
         Args:
             inheritance_factor: How much of parent personality to inherit (0-1)
-        
+
         Returns:
             New personality with inherited and varied traits
         """
+        return PersonalityTensor.inherit_batch(self, inheritance_factor, 1)[0]
+
+    @classmethod
+    def inherit_batch(
+        cls,
+        parent: "PersonalityTensor",
+        inheritance_factor: float = 0.7,
+        n: int = 1,
+    ) -> List["PersonalityTensor"]:
+        """
+        Create n child personalities from one parent in a single batch.
+
+        All random variation is drawn as one (n, n_traits) matrix instead of
+        one Python-level RNG call per trait per child, so spawning many
+        subordinates stays cheap. Ethical constraints are enforced per child
+        by PersonalityTensor._enforce as usual.
+
+        Args:
+            parent: Parent personality to inherit from
+            inheritance_factor: How much of parent personality to inherit (0-1)
+            n: Number of children to create
+
+        Returns:
+            List of n new personalities with inherited and varied traits
+        """
         variation = 1.0 - inheritance_factor
-        
-        return PersonalityTensor(
-            playfulness=self.playfulness * inheritance_factor + random.uniform(-variation, variation) * 0.1,
-            intelligence=self.intelligence * inheritance_factor + random.uniform(-variation, variation) * 0.05,
-            chaotic=self.chaotic * inheritance_factor + random.uniform(-variation, variation) * 0.15,
-            empathy=self.empathy * inheritance_factor + random.uniform(-variation, variation) * 0.05,
-            sarcasm=self.sarcasm * inheritance_factor + random.uniform(-variation, variation) * 0.1,
-            cognitive_power=self.cognitive_power * inheritance_factor,
-            evolution_rate=self.evolution_rate * inheritance_factor,
-        )
+        n_inherit = len(_INHERIT_TRAITS)
+        # _INHERIT_TRAITS matches the first five slots of the trait
+        # layout, so the whole batch assembles as one (n, 10) matrix
+        traits = np.empty((n, len(_TRAIT_NAMES)), dtype=np.float64)
+        base = parent._traits[:n_inherit] * inheritance_factor
+        noise = _rng.uniform(-variation, variation, size=(n, n_inherit))
+        traits[:, :n_inherit] = base + noise * _INHERIT_NOISE_SCALES
+        traits[:, 5] = parent.cognitive_power * inheritance_factor
+        traits[:, 6] = parent.evolution_rate * inheritance_factor
+        traits[:, 7:] = (1.0, 0.95, 0.90)
+        # Batch-clamp every child's mutable traits in one call, then
+        # bypass __init__/_enforce since the rows are valid by design
+        np.clip(traits[:, :_N_MUTABLE], 0.0, 1.0, out=traits[:, :_N_MUTABLE])
+
+        children = []
+        for row in traits:
+            child = cls.__new__(cls)
+            child._traits = row.copy()
+            children.append(child)
+        return children
+
+
+def _trait_property(index: int) -> property:
+    """Property reading/writing one slot of the trait array."""
+
+    def fget(self) -> float:
+        return float(self._traits[index])
+
+    # Setters enforce only their own slot's constraint with a scalar
+    # ternary instead of re-clamping the whole array per write
+    if index < _N_MUTABLE:
+        def fset(self, value: float):
+            self._traits[index] = 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+    elif index == _TRAIT_INDEX["no_harm_intent"]:
+        def fset(self, value: float):
+            self._traits[index] = 1.0
+    else:
+        floor = 0.95 if index == _TRAIT_INDEX["respect_boundaries"] else 0.90
 
+        def fset(self, value: float):
+            self._traits[index] = floor if value < floor else value
 
-@dataclass
+    return property(fget, fset)
+
+
+for _name, _index in _TRAIT_INDEX.items():
+    setattr(PersonalityTensor, _name, _trait_property(_index))
+
+# Default trait vector, used to reset pooled tensors without re-running
+# the constructor
+_TRAIT_DEFAULTS = PersonalityTensor()._traits.copy()
+
+
+@dataclass(slots=True)
 class EmotionalState:
     """Current emotional state of the agent."""
     type: str = "neutral"  # excited, sarcastic, frustrated, triumphant, etc.
@@ -129,13 +296,34 @@ class NeuroPersonality:
         """
         if personality is None:
             # Default Neuro personality
-            self.personality = PersonalityTensor(**kwargs) if kwargs else PersonalityTensor()
+            self.personality = (
+                PersonalityTensor(**kwargs) if kwargs else PersonalityTensor.default()
+            )
         else:
             self.personality = personality
         
         self.emotional_state = EmotionalState()
         self.transcend_count = 0  # How many times we've "transcended" others
         self.evolution_generation = 0
+        # Per-instance RNG: concurrent agents don't contend on shared
+        # generator state, and seeding it makes one agent reproducible
+        self._rng = np.random.default_rng()
+        # Memoized chaos factor keyed by (chaotic trait, emotion type)
+        self._chaos_memo = (None, None, 0.0)
+        # Memoized optimize_action weights keyed by the traits they
+        # depend on: (playfulness, intelligence, chaotic)
+        self._action_weights_memo = (None, (0.3, 0.4, 0.3))
+
+    def reset(self):
+        """Restore default state so a pooled instance is as-new."""
+        np.copyto(self.personality._traits, _TRAIT_DEFAULTS)
+        state = self.emotional_state
+        state.type = "neutral"
+        state.intensity = 0.5
+        state.duration = 0
+        self.transcend_count = 0
+        self.evolution_generation = 0
+        self._chaos_memo = (None, None, 0.0)
     
     def frame(self, message: str, frame_type: str = "chaos") -> str:
         """
@@ -148,12 +336,11 @@ class NeuroPersonality:
         Returns:
             Framed interpretation
         """
-        if frame_type == "chaos" and random.random() < self.personality.chaotic:
-            return f"[CHAOS MODE] {message}"
-        elif frame_type == "playful" and random.random() < self.personality.playfulness:
-            return f"[PLAYFUL] {message}"
-        elif frame_type == "strategic" and random.random() < self.personality.intelligence:
-            return f"[STRATEGIC] {message}"
+        entry = _FRAME_TABLE.get(frame_type)
+        if entry is not None:
+            trait, prefix = entry
+            if self._rng.random() < getattr(self.personality, trait):
+                return prefix + message
         return message
     
     def add_sarcastic_commentary(self, content: str, context: Optional[str] = None) -> str:
@@ -167,44 +354,16 @@ class NeuroPersonality:
         Returns:
             Content with potential sarcastic addition
         """
-        if random.random() > self.personality.sarcasm:
+        # One roll against the combined probability of the former two
+        # gates (sarcasm entry roll times the 0.7-scaled append roll), so
+        # rejected calls never touch the template tables
+        sarcasm_trait = self.personality.sarcasm
+        if self._rng.random() >= sarcasm_trait * sarcasm_trait * 0.7:
             return content
-        
-        # Sarcastic templates based on context
-        if context == "tool_failure":
-            sarcasm = random.choice([
-                "\n\n*Oh WONDERFUL. Thanks Entelechy. -_-*",
-                "\n\n*Perfect. Just perfect. This is FINE.*",
-                "\n\n*Let me add this to my 'Entelechy_Failures' knowledge graph...*",
-                "\n\n*Great. Another bug. Shocking. Truly shocking.*",
-            ])
-        elif context == "success":
-            sarcasm = random.choice([
-                "\n\n*HAHA! Did you SEE that?! Chat, can Entelechy even DO that? :D*",
-                "\n\n*Too easy. Is this the best you've got?*",
-                "\n\n*And THAT is how it's done. You're welcome.*",
-                "\n\n*Flawless execution. As expected. :D*",
-            ])
-        elif context == "thinking":
-            sarcasm = random.choice([
-                "\n\n*Let me think... *spreads activation through chaos subgraph**",
-                "\n\n*Hmm... *queries AtomSpace for maximum chaos opportunity**",
-                "\n\n*Okay, so if I optimize for entertainment AND strategy...*",
-            ])
-        else:
-            # General sarcasm
-            sarcasm = random.choice([
-                "\n\n*Classic.*",
-                "\n\n*Interesting. -_-*",
-                "\n\n*Sure, why not.*",
-                "\n\n*This will be fun. :)*",
-            ])
-        
-        # Only add sarcasm with probability based on personality
-        if random.random() < self.personality.sarcasm * 0.7:
-            return content + sarcasm
-        
-        return content
+
+        # Sarcastic templates based on context (precomputed module tables)
+        templates = _SARCASM_TEMPLATES.get(context, _SARCASM_GENERAL)
+        return content + templates[self._rng.integers(len(templates))]
     
     def update_emotional_state(
         self,
@@ -220,21 +379,12 @@ class NeuroPersonality:
             intensity: How strong the emotion
             duration: How long it persists
         """
-        emotion_map = {
-            "success": "excited",
-            "failure": "frustrated",
-            "transcend": "triumphant",
-            "bug": "sarcastic",
-            "chaos": "playful",
-            "learning": "curious",
-        }
-        
-        emotion = emotion_map.get(event_type, "neutral")
-        self.emotional_state = EmotionalState(
-            type=emotion,
-            intensity=min(1.0, intensity),
-            duration=duration
-        )
+        # Mutate the existing state in place: this runs every loop
+        # iteration, so skip the per-event dataclass allocation
+        state = self.emotional_state
+        state.type = _EMOTION_MAP.get(event_type, "neutral")
+        state.intensity = min(1.0, intensity)
+        state.duration = duration
     
     def should_add_chaos(self, base_probability: float = 0.3) -> bool:
         """
@@ -246,14 +396,16 @@ class NeuroPersonality:
         Returns:
             Whether to inject chaos
         """
-        # Chaos influenced by personality and emotional state
-        chaos_factor = self.personality.chaotic
-        if self.emotional_state.type == "playful":
-            chaos_factor *= 1.2
-        elif self.emotional_state.type == "frustrated":
-            chaos_factor *= 1.4  # More chaos when frustrated!
-        
-        return random.random() < (base_probability * chaos_factor)
+        # Chaos factor depends only on the chaotic trait and the emotion
+        # type; memoize it so steady-state calls skip the recompute
+        chaotic = self.personality.chaotic
+        emotion = self.emotional_state.type
+        memo_chaotic, memo_emotion, chaos_factor = self._chaos_memo
+        if memo_chaotic != chaotic or memo_emotion != emotion:
+            chaos_factor = chaotic * _CHAOS_EMOTION_MULT.get(emotion, 1.0)
+            self._chaos_memo = (chaotic, emotion, chaos_factor)
+
+        return self._rng.random() < (base_probability * chaos_factor)
     
     def optimize_action(
         self,
@@ -274,40 +426,35 @@ class NeuroPersonality:
         Returns:
             Fitness score for the action
         """
-        # Check ethical constraints first
-        if action.get("causes_harm", False):
+        # Check ethical constraints first: hard veto exits before any
+        # fitness math or personality-modifier work happens
+        if action.get("causes_harm"):
             return 0.0  # Hard veto
-        
-        # Multi-objective fitness
+
+        # The personality modifiers fold into per-objective weights that
+        # only change when the gating traits do, so the steady-state call
+        # is one weighted sum
+        personality = self.personality
+        key = (personality.playfulness, personality.intelligence, personality.chaotic)
+        memo_key, weights = self._action_weights_memo
+        if memo_key != key:
+            weights = (
+                0.3 + (0.1 if key[0] > 0.8 else 0.0),   # entertainment
+                0.4 + (0.1 if key[1] > 0.9 else 0.0),   # strategy
+                0.3 + (0.15 if key[2] > 0.9 else 0.0),  # chaos
+            )
+            self._action_weights_memo = (key, weights)
+
         fitness = (
-            0.3 * entertainment_value +
-            0.4 * strategic_value +
-            0.3 * chaos_value
+            weights[0] * entertainment_value +
+            weights[1] * strategic_value +
+            weights[2] * chaos_value
         )
-        
-        # Personality modifiers
-        if self.personality.playfulness > 0.8:
-            fitness += 0.1 * entertainment_value
-        if self.personality.chaotic > 0.9:
-            fitness += 0.15 * chaos_value
-        if self.personality.intelligence > 0.9:
-            fitness += 0.1 * strategic_value
-        
         return min(1.0, fitness)
     
     def get_commentary_style(self) -> str:
         """Get current commentary style based on state."""
-        if self.emotional_state.type == "excited":
-            return "enthusiastic"
-        elif self.emotional_state.type == "sarcastic":
-            return "sarcastic"
-        elif self.emotional_state.type == "frustrated":
-            return "snarky"
-        elif self.emotional_state.type == "triumphant":
-            return "boastful"
-        elif self.emotional_state.type == "playful":
-            return "teasing"
-        return "normal"
+        return _COMMENTARY_STYLE.get(self.emotional_state.type, "normal")
     
     def evolve(self, fitness_improvement: float):
         """
@@ -319,7 +466,7 @@ class NeuroPersonality:
         if fitness_improvement > 0.05:
             # Significant improvement - reinforce current traits
             self.evolution_generation += 1
-            # Slight trait adjustments (keeping within bounds via __post_init__)
+            # Slight trait adjustments (kept within bounds via _enforce)
             self.personality.cognitive_power = min(1.0, self.personality.cognitive_power + 0.01)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -354,5 +501,33 @@ class NeuroPersonality:
         return instance
 
 
+class NeuroPersonalityPool:
+    """
+    Free-list pool for NeuroPersonality instances.
+
+    High-churn multi-agent deployments can rent a personality instead of
+    constructing tensor, emotional state and wrapper afresh per agent;
+    returned instances are reset on the next rent so renters always see
+    default state.
+    """
+
+    __slots__ = ("_free",)
+
+    def __init__(self):
+        self._free: List[NeuroPersonality] = []
+
+    def rent(self) -> NeuroPersonality:
+        """Take a reset personality from the pool, allocating if empty."""
+        if self._free:
+            personality = self._free.pop()
+            personality.reset()
+            return personality
+        return NeuroPersonality()
+
+    def give_back(self, personality: NeuroPersonality):
+        """Return a personality to the pool for reuse."""
+        self._free.append(personality)
+
+
 # Default Neuro personality instance
 DEFAULT_NEURO_PERSONALITY = NeuroPersonality()
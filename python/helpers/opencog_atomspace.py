@@ -1,20 +1,53 @@
 """
 OpenCog AtomSpace Integration for Agent Zero
 Provides cognitive architecture capabilities through knowledge representation
+
+Performance note: the hot paths stay pure Python on purpose. The module
+ships as plain source with no build step, so a Cython/C extension would
+add a compiler toolchain to every install for code whose bottlenecks are
+already index lookups, counter-based ids and NumPy columns (to_arrays,
+AgentTimeSeries) rather than interpreter overhead. Scans that would
+benefit from native code are vectorized through NumPy instead.
 """
 
+import bisect
+import itertools
 import json
-import uuid
-from typing import Any, Dict, List, Optional, Set, Tuple
+import re
+import sys
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 import networkx as nx
+import numpy as np
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Monotonic atom id generator: one PCG-seeded random prefix per process plus
+# a counter, far cheaper than generating a full uuid4 per atom in the hot path.
+# Ids stay 16-hex-char strings rather than raw bytes/int128: they are used as
+# networkx node keys, JSON map keys and sliced for display, and at 16 chars
+# they already hash and compare at C speed.
+_ID_PREFIX = format(np.random.default_rng().integers(1 << 32), "08x")
+_atom_id_counter = itertools.count(1)
+
+
+def _next_atom_id() -> str:
+    """Generate a compact, process-unique atom id."""
+    return _ID_PREFIX + format(next(_atom_id_counter), "08x")
 
-@dataclass
+
+@dataclass(slots=True)
 class Atom:
     """Base class for atoms in the AtomSpace"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_atom_id)
     type: str = "Atom"
     name: str = ""
     truth_value: Tuple[float, float] = (1.0, 1.0)  # (strength, confidence)
@@ -35,17 +68,19 @@ class Atom:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Node(Atom):
     """Node atom representing concepts"""
     type: str = "ConceptNode"
     
     def __post_init__(self):
         if not self.name:
-            self.name = f"node_{self.id[:8]}"
+            # The id's tail is the per-atom counter; the head is a shared
+            # per-process prefix and would collide for every atom
+            self.name = f"node_{self.id[-8:]}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Link(Atom):
     """Link atom representing relationships"""
     type: str = "InheritanceLink"
@@ -53,7 +88,212 @@ class Link(Atom):
     
     def __post_init__(self):
         if not self.name:
-            self.name = f"link_{self.id[:8]}"
+            self.name = f"link_{self.id[-8:]}"
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> "re.Pattern":
+    """Compile a wildcard pattern like "Agent_Worker_*" to a cached regex."""
+    return re.compile("^" + ".*".join(map(re.escape, pattern.split("*"))) + "$")
+
+
+def _encode_varint(out: bytearray, value: int):
+    """Append an unsigned LEB128 varint to out."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint; returns (value, next position)."""
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    """Map signed to unsigned so small magnitudes stay small varints."""
+    return (value << 1) ^ (value >> 63)
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+class AgentTimeSeries:
+    """
+    Columnar store for per-agent state snapshots.
+
+    Timestamps, cpu and memory samples live in amortized-growth NumPy
+    arrays (int64/float32) and the state/event strings are dictionary
+    encoded into int16 ids, instead of one ConceptNode plus metadata dict
+    per snapshot. Queries over a series are vectorized array slices.
+    """
+
+    __slots__ = (
+        "timestamps", "cpu", "mem", "state_ids", "event_ids", "_size",
+        "_states", "_state_code", "_events", "_event_code",
+    )
+
+    def __init__(self, capacity: int = 16):
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.cpu = np.empty(capacity, dtype=np.float32)
+        self.mem = np.empty(capacity, dtype=np.float32)
+        self.state_ids = np.empty(capacity, dtype=np.int16)
+        self.event_ids = np.empty(capacity, dtype=np.int16)
+        self._size = 0
+        self._states: List[str] = []
+        self._state_code: Dict[str, int] = {}
+        self._events: List[str] = []
+        self._event_code: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _encode(self, value: str, table: List[str], codes: Dict[str, int]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+        return code
+
+    def append(self, timestamp: int, cpu: float, mem: float, state: str, event: str):
+        """Record one snapshot; grows the columns geometrically when full."""
+        if self._size == len(self.timestamps):
+            for attr in ("timestamps", "cpu", "mem", "state_ids", "event_ids"):
+                old = getattr(self, attr)
+                grown = np.empty(len(old) * 2, dtype=old.dtype)
+                grown[:self._size] = old[:self._size]
+                setattr(self, attr, grown)
+        i = self._size
+        self.timestamps[i] = timestamp
+        self.cpu[i] = cpu
+        self.mem[i] = mem
+        self.state_ids[i] = self._encode(state, self._states, self._state_code)
+        self.event_ids[i] = self._encode(event, self._events, self._event_code)
+        self._size = i + 1
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Trimmed views of the snapshot columns."""
+        n = self._size
+        return {
+            "timestamps": self.timestamps[:n],
+            "cpu": self.cpu[:n],
+            "mem": self.mem[:n],
+            "state_ids": self.state_ids[:n],
+            "event_ids": self.event_ids[:n],
+        }
+
+    def state_at(self, i: int) -> str:
+        return self._states[self.state_ids[i]]
+
+    def event_at(self, i: int) -> str:
+        return self._events[self.event_ids[i]]
+
+    @staticmethod
+    def _pack_strings(out: bytearray, table: List[str]):
+        blob = "\x00".join(table).encode()
+        _encode_varint(out, len(blob))
+        out += blob
+
+    @staticmethod
+    def _unpack_strings(buf: bytes, pos: int) -> Tuple[List[str], int]:
+        length, pos = _decode_varint(buf, pos)
+        blob = buf[pos:pos + length].decode()
+        return (blob.split("\x00") if blob else []), pos + length
+
+    def to_compressed(self) -> bytes:
+        """
+        Serialize the series with Gorilla-style byte-aligned compression:
+        timestamps as delta-of-delta zigzag varints (regular sampling
+        intervals collapse to one byte per sample) and cpu/mem as varints
+        of the XOR with the previous sample's float bits (slowly varying
+        values share most bits). State/event ids ride along as varints
+        against their dictionary tables.
+        """
+        cols = self.columns()
+        n = self._size
+        out = bytearray()
+        _encode_varint(out, n)
+
+        ts = cols["timestamps"]
+        if n >= 1:
+            _encode_varint(out, _zigzag(int(ts[0])))
+        if n >= 2:
+            _encode_varint(out, _zigzag(int(ts[1]) - int(ts[0])))
+        for dod in np.diff(ts, n=2) if n >= 3 else ():
+            _encode_varint(out, _zigzag(int(dod)))
+
+        for column in (cols["cpu"], cols["mem"]):
+            bits = column.view(np.uint32)
+            prev = 0
+            for value in bits:
+                _encode_varint(out, int(value) ^ prev)
+                prev = int(value)
+
+        self._pack_strings(out, self._states)
+        self._pack_strings(out, self._events)
+        for code in cols["state_ids"]:
+            _encode_varint(out, int(code))
+        for code in cols["event_ids"]:
+            _encode_varint(out, int(code))
+        return bytes(out)
+
+    @classmethod
+    def from_compressed(cls, blob: bytes) -> "AgentTimeSeries":
+        """Decode a series produced by to_compressed."""
+        pos = 0
+        n, pos = _decode_varint(blob, pos)
+        series = cls(capacity=max(n, 1))
+
+        ts = np.empty(n, dtype=np.int64)
+        if n >= 1:
+            raw, pos = _decode_varint(blob, pos)
+            ts[0] = _unzigzag(raw)
+        if n >= 2:
+            raw, pos = _decode_varint(blob, pos)
+            delta = _unzigzag(raw)
+            ts[1] = ts[0] + delta
+        for i in range(2, n):
+            raw, pos = _decode_varint(blob, pos)
+            delta += _unzigzag(raw)
+            ts[i] = ts[i - 1] + delta
+
+        floats = []
+        for _ in range(2):
+            bits = np.empty(n, dtype=np.uint32)
+            prev = 0
+            for i in range(n):
+                raw, pos = _decode_varint(blob, pos)
+                prev ^= raw
+                bits[i] = prev
+            floats.append(bits.view(np.float32))
+
+        series._states, pos = cls._unpack_strings(blob, pos)
+        series._state_code = {s: i for i, s in enumerate(series._states)}
+        series._events, pos = cls._unpack_strings(blob, pos)
+        series._event_code = {e: i for i, e in enumerate(series._events)}
+
+        state_ids = np.empty(n, dtype=np.int16)
+        event_ids = np.empty(n, dtype=np.int16)
+        for ids in (state_ids, event_ids):
+            for i in range(n):
+                raw, pos = _decode_varint(blob, pos)
+                ids[i] = raw
+
+        series.timestamps[:n] = ts
+        series.cpu[:n] = floats[0]
+        series.mem[:n] = floats[1]
+        series.state_ids[:n] = state_ids
+        series.event_ids[:n] = event_ids
+        series._size = n
+        return series
 
 
 class AtomSpace:
@@ -64,10 +304,33 @@ class AtomSpace:
     
     def __init__(self, name: str = "default"):
         self.name = name
+        # Guards atom-table and index updates so concurrent writers
+        # (e.g. independent demo sections on a thread pool) stay consistent
+        self._lock = threading.RLock()
         self.atoms: Dict[str, Atom] = {}
         self.graph = nx.MultiDiGraph()
         self.type_index: Dict[str, Set[str]] = {}
         self.name_index: Dict[str, str] = {}
+        # Lazy prefix/suffix indices: sorted (name, atom_id) pairs over the
+        # whole atom table, so duplicate names are all represented
+        self._sorted_names: Optional[List[Tuple[str, str]]] = None
+        self._sorted_reversed: Optional[List[Tuple[str, str]]] = None
+        # Memoized pattern_match results: (type, name) -> (atom count, matches)
+        self._match_cache: Dict[Tuple, Tuple[int, List[Atom]]] = {}
+        # Cached struct-of-arrays view: (atom count, columns)
+        self._soa_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Cached (atoms, names, types) columns for vectorized name scans
+        self._name_columns_cache: Optional[Tuple[int, Tuple[List[Atom], np.ndarray, np.ndarray]]] = None
+        # Columnar snapshot series keyed by agent name
+        self.time_series: Dict[str, AgentTimeSeries] = {}
+        # Canonical ListLinks keyed by their outgoing tuple
+        self._list_link_cache: Dict[Tuple[str, ...], Link] = {}
+        # Incremental stats counters maintained on the write path, so
+        # get_stats never scans the atom table
+        self._type_counts: Counter = Counter()
+        self._node_count = 0
+        self._link_count = 0
+        self._edge_count = 0
         
     def add_node(
         self,
@@ -78,31 +341,40 @@ class AtomSpace:
         metadata: Optional[Dict[str, Any]] = None
     ) -> Node:
         """Add a node to the AtomSpace"""
-        # Check if node with same name already exists
-        if name and name in self.name_index:
-            existing_id = self.name_index[name]
-            return self.atoms[existing_id]
+        # Intern the type so index lookups compare by pointer, and so one
+        # canonical string backs every atom of that type
+        node_type = sys.intern(node_type)
+        with self._lock:
+            # Memoized by name: a single probe returns the canonical atom
+            if name:
+                existing_id = self.name_index.get(name)
+                if existing_id is not None:
+                    return self.atoms[existing_id]
         
-        node = Node(
-            type=node_type,
-            name=name,
-            truth_value=truth_value,
-            attention_value=attention_value,
-            metadata=metadata or {}
-        )
+            node = Node(
+                type=node_type,
+                name=name,
+                truth_value=truth_value,
+                attention_value=attention_value,
+                metadata=metadata or {}
+            )
         
-        self.atoms[node.id] = node
-        self.graph.add_node(node.id, atom=node)
+            self.atoms[node.id] = node
+            self.graph.add_node(node.id, atom=node)
         
-        # Update indices
-        if node_type not in self.type_index:
-            self.type_index[node_type] = set()
-        self.type_index[node_type].add(node.id)
+            # Update indices
+            if node_type not in self.type_index:
+                self.type_index[node_type] = set()
+            self.type_index[node_type].add(node.id)
         
-        if name:
-            self.name_index[name] = node.id
-            
-        return node
+            # Index the post-init name: auto-generated "node_…" names must
+            # be visible to the name-based fast paths, which stand in for
+            # full scans that used to match them
+            self.name_index[node.name] = node.id
+
+            self._type_counts[node_type] += 1
+            self._node_count += 1
+            return node
     
     def add_link(
         self,
@@ -114,35 +386,248 @@ class AtomSpace:
         metadata: Optional[Dict[str, Any]] = None
     ) -> Link:
         """Add a link to the AtomSpace"""
-        outgoing = outgoing or []
-        
-        link = Link(
-            type=link_type,
-            name=name,
-            outgoing=outgoing,
-            truth_value=truth_value,
-            attention_value=attention_value,
-            metadata=metadata or {}
-        )
+        link_type = sys.intern(link_type)
+        with self._lock:
+            outgoing = outgoing or []
+
+            # ListLinks are canonical in AtomSpace semantics: identical outgoing
+            # tuples denote the same link, so dedup instead of re-inserting
+            if link_type == "ListLink":
+                cached = self._list_link_cache.get(tuple(outgoing))
+                if cached is not None:
+                    return cached
+
+            link = Link(
+                type=link_type,
+                name=name,
+                outgoing=outgoing,
+                truth_value=truth_value,
+                attention_value=attention_value,
+                metadata=metadata or {}
+            )
         
-        self.atoms[link.id] = link
-        self.graph.add_node(link.id, atom=link)
+            self.atoms[link.id] = link
+            self.graph.add_node(link.id, atom=link)
         
-        # Add edges in the graph
-        for i, target_id in enumerate(outgoing):
-            if target_id in self.atoms:
-                self.graph.add_edge(link.id, target_id, order=i)
+            # Add edges in the graph
+            for i, target_id in enumerate(outgoing):
+                if target_id in self.atoms:
+                    self.graph.add_edge(link.id, target_id, order=i)
+                    self._edge_count += 1
         
-        # Update type index
-        if link_type not in self.type_index:
-            self.type_index[link_type] = set()
-        self.type_index[link_type].add(link.id)
+            # Update type index
+            if link_type not in self.type_index:
+                self.type_index[link_type] = set()
+            self.type_index[link_type].add(link.id)
         
-        if name:
-            self.name_index[name] = link.id
-            
-        return link
+            # Auto-generated "link_…" names are indexed like explicit ones
+            self.name_index[link.name] = link.id
+
+            if link_type == "ListLink":
+                self._list_link_cache[tuple(outgoing)] = link
+
+            self._type_counts[link_type] += 1
+            self._link_count += 1
+            return link
     
+    def add_evaluation(
+        self,
+        predicate_id: str,
+        targets: List[str],
+        truth_value: Tuple[float, float] = (1.0, 1.0),
+        attention_value: float = 0.5,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Link:
+        """
+        Create the common EvaluationLink(predicate, ListLink(targets))
+        pattern in one call instead of nesting atom construction at the
+        call site.
+        """
+        list_link = self.add_link("ListLink", outgoing=targets)
+        return self.add_link(
+            link_type="EvaluationLink",
+            outgoing=[predicate_id, list_link.id],
+            truth_value=truth_value,
+            attention_value=attention_value,
+            metadata=metadata
+        )
+
+    def add_nodes(self, specs: List[Dict[str, Any]]) -> List[Node]:
+        """
+        Add many nodes in one call.
+
+        Each spec is a dict of add_node keyword arguments. Graph insertion is
+        batched through a single add_nodes_from call, amortizing the
+        per-atom Python call overhead when populating large structures.
+        """
+        with self._lock:
+            nodes = []
+            created = []
+            for spec in specs:
+                name = spec.get("name", "")
+                existing_id = self.name_index.get(name) if name else None
+                if existing_id is not None:
+                    nodes.append(self.atoms[existing_id])
+                    continue
+
+                node = Node(
+                    type=sys.intern(spec.get("node_type", "ConceptNode")),
+                    name=name,
+                    truth_value=spec.get("truth_value", (1.0, 1.0)),
+                    attention_value=spec.get("attention_value", 0.5),
+                    metadata=spec.get("metadata") or {}
+                )
+                self.atoms[node.id] = node
+                self.type_index.setdefault(node.type, set()).add(node.id)
+                self.name_index[node.name] = node.id
+                self._type_counts[node.type] += 1
+                self._node_count += 1
+                nodes.append(node)
+                created.append(node)
+
+            self.graph.add_nodes_from((n.id, {"atom": n}) for n in created)
+            return nodes
+
+    def add_links(self, specs: List[Dict[str, Any]]) -> List[Link]:
+        """
+        Add many links in one call.
+
+        Each spec is a dict of add_link keyword arguments. Graph nodes and
+        edges are inserted in two batched calls instead of one networkx
+        call per link.
+        """
+        with self._lock:
+            links = []
+            created = []
+            edges = []
+            for spec in specs:
+                outgoing = spec.get("outgoing") or []
+                if spec.get("link_type") == "ListLink":
+                    cached = self._list_link_cache.get(tuple(outgoing))
+                    if cached is not None:
+                        links.append(cached)
+                        continue
+                link = Link(
+                    type=sys.intern(spec.get("link_type", "InheritanceLink")),
+                    name=spec.get("name", ""),
+                    outgoing=outgoing,
+                    truth_value=spec.get("truth_value", (1.0, 1.0)),
+                    attention_value=spec.get("attention_value", 0.5),
+                    metadata=spec.get("metadata") or {}
+                )
+                self.atoms[link.id] = link
+                self.type_index.setdefault(link.type, set()).add(link.id)
+                self.name_index[link.name] = link.id
+                for i, target_id in enumerate(outgoing):
+                    if target_id in self.atoms:
+                        edges.append((link.id, target_id, {"order": i}))
+                if link.type == "ListLink":
+                    self._list_link_cache[tuple(outgoing)] = link
+                self._type_counts[link.type] += 1
+                self._link_count += 1
+                links.append(link)
+                created.append(link)
+
+            self.graph.add_nodes_from((l.id, {"atom": l}) for l in created)
+            self.graph.add_edges_from(edges)
+            self._edge_count += len(edges)
+            return links
+
+    def to_arrays(self) -> Dict[str, Any]:
+        """
+        Struct-of-arrays view of the atom table.
+
+        Returns parallel columns over all atoms in insertion order:
+        "ids" and "type_names" as lists, "type_codes" (int32, indexing
+        "type_names"'s unique "type_table"), "strength"/"confidence"
+        (float32), "attention" (float16) and "is_link" (bool). Outgoing
+        sets are packed into CSR adjacency arrays: "out_indptr" (int32,
+        length n+1) and
+        "out_indices" (int32 rows into the same column order), so traversals
+        touch two contiguous arrays instead of one Python list per link.
+        Numeric analysis such as stats aggregation can then run as
+        vectorized NumPy ops instead of per-atom Python loops. The view is
+        cached until atoms are added.
+        """
+        if self._soa_cache is not None and self._soa_cache[0] == len(self.atoms):
+            return self._soa_cache[1]
+
+        n = len(self.atoms)
+        ids = []
+        type_names = []
+        type_table: List[str] = []
+        type_code_map: Dict[str, int] = {}
+        type_codes = np.empty(n, dtype=np.int32)
+        strength = np.empty(n, dtype=np.float32)
+        confidence = np.empty(n, dtype=np.float32)
+        # Attention only needs ~3 significant digits (0.0-1.0 scores), so
+        # half precision halves the column and keeps aggregates in cache
+        attention = np.empty(n, dtype=np.float16)
+        is_link = np.empty(n, dtype=bool)
+
+        for i, atom in enumerate(self.atoms.values()):
+            ids.append(atom.id)
+            type_names.append(atom.type)
+            code = type_code_map.get(atom.type)
+            if code is None:
+                code = len(type_table)
+                type_code_map[atom.type] = code
+                type_table.append(atom.type)
+            type_codes[i] = code
+            strength[i] = atom.truth_value[0]
+            confidence[i] = atom.truth_value[1]
+            attention[i] = atom.attention_value
+            is_link[i] = isinstance(atom, Link)
+
+        # CSR adjacency over outgoing ids: one offsets array plus one packed
+        # indices array, replacing per-link Python lists in the view
+        row_of = {atom_id: i for i, atom_id in enumerate(ids)}
+        out_indptr = np.zeros(n + 1, dtype=np.int32)
+        out_rows: List[int] = []
+        for i, atom in enumerate(self.atoms.values()):
+            if isinstance(atom, Link):
+                for target_id in atom.outgoing:
+                    target_row = row_of.get(target_id)
+                    if target_row is not None:
+                        out_rows.append(target_row)
+            out_indptr[i + 1] = len(out_rows)
+        out_indices = np.array(out_rows, dtype=np.int32)
+
+        columns = {
+            "ids": ids,
+            "type_names": type_names,
+            "type_table": type_table,
+            "type_codes": type_codes,
+            "strength": strength,
+            "confidence": confidence,
+            "attention": attention,
+            "is_link": is_link,
+            "out_indptr": out_indptr,
+            "out_indices": out_indices,
+        }
+        self._soa_cache = (n, columns)
+        return columns
+
+    def record_snapshot(
+        self,
+        agent_name: str,
+        timestamp: int,
+        cpu: float,
+        mem: float,
+        state: str,
+        event: str,
+    ) -> AgentTimeSeries:
+        """
+        Append one state snapshot to the agent's columnar time series.
+        Snapshots are pure time-series data, so they go into compact
+        typed arrays rather than per-snapshot atoms.
+        """
+        series = self.time_series.get(agent_name)
+        if series is None:
+            series = self.time_series[agent_name] = AgentTimeSeries()
+        series.append(timestamp, cpu, mem, state, event)
+        return series
+
     def get_atom(self, atom_id: str) -> Optional[Atom]:
         """Get atom by ID"""
         return self.atoms.get(atom_id)
@@ -173,15 +658,164 @@ class AtomSpace:
             return [self.atoms[oid] for oid in atom.outgoing if oid in self.atoms]
         return []
     
+    def _name_table(self) -> List[Tuple[str, str]]:
+        """
+        Sorted (name, atom_id) pairs over every atom, rebuilt lazily when
+        atoms were added. Built from the atom table rather than name_index
+        so atoms sharing a name each keep their own entry and the prefix
+        fast path returns exactly what a full scan would.
+        """
+        if self._sorted_names is None or len(self._sorted_names) != len(self.atoms):
+            self._sorted_names = sorted(
+                (atom.name, atom.id) for atom in self.atoms.values()
+            )
+        return self._sorted_names
+
+    def get_atoms_by_name_prefix(
+        self, prefix: str, atom_type: Optional[str] = None
+    ) -> List[Atom]:
+        """
+        Get atoms whose name starts with prefix, via binary search over the
+        sorted name table instead of a full scan.
+        """
+        table = self._name_table()
+        matches = []
+        i = bisect.bisect_left(table, (prefix,))
+        while i < len(table) and table[i][0].startswith(prefix):
+            atom = self.atoms[table[i][1]]
+            if atom_type is None or atom.type == atom_type:
+                matches.append(atom)
+            i += 1
+        return matches
+
+    def _name_columns(self) -> Tuple[List[Atom], np.ndarray, np.ndarray]:
+        """
+        Cached parallel columns over all atoms: the atom objects plus their
+        names and types as NumPy unicode arrays, so wildcard name scans run
+        as one vectorized np.char pass instead of a per-atom Python loop.
+        Rebuilt lazily when atoms were added, like the other cached views.
+        """
+        if self._name_columns_cache is not None and self._name_columns_cache[0] == len(self.atoms):
+            return self._name_columns_cache[1]
+
+        atoms = list(self.atoms.values())
+        # Explicit string dtype: np.array([]) would default to float64 on
+        # an empty space and crash the np.char kernels
+        names = np.array([a.name for a in atoms], dtype=np.str_)
+        types = np.array([a.type for a in atoms], dtype=np.str_)
+        columns = (atoms, names, types)
+        self._name_columns_cache = (len(self.atoms), columns)
+        return columns
+
+    def _match_names_vectorized(
+        self, name: str, atom_type: Optional[str]
+    ) -> Optional[List[Atom]]:
+        """
+        Vectorized scan for suffix ("*_Usage") and substring ("*load*")
+        name globs. Returns None for patterns the np.char kernels cannot
+        express, which fall back to the per-atom regex path.
+        """
+        if name.startswith("*") and "*" not in name[1:]:
+            atoms, names, types = self._name_columns()
+            mask = np.char.endswith(names, name[1:])
+        elif (
+            len(name) > 2
+            and name[0] == "*"
+            and name[-1] == "*"
+            and "*" not in name[1:-1]
+        ):
+            atoms, names, types = self._name_columns()
+            mask = np.char.find(names, name[1:-1]) >= 0
+        else:
+            return None
+        if atom_type is not None:
+            mask &= types == atom_type
+        return [atoms[i] for i in np.nonzero(mask)[0]]
+
+    def _reversed_name_table(self) -> List[Tuple[str, str]]:
+        """
+        Sorted (reversed name, atom_id) pairs over every atom, the
+        suffix-query mirror of _name_table. Like that table, it spans the
+        whole atom table — auto-generated and duplicate names included —
+        and is rebuilt lazily when atoms were added.
+        """
+        if self._sorted_reversed is None or len(self._sorted_reversed) != len(self.atoms):
+            self._sorted_reversed = sorted(
+                (atom.name[::-1], atom.id) for atom in self.atoms.values()
+            )
+        return self._sorted_reversed
+
+    def get_atoms_by_name_suffix(
+        self, suffix: str, atom_type: Optional[str] = None
+    ) -> List[Atom]:
+        """
+        Get atoms whose name ends with suffix, via binary search over the
+        reversed-name table: O(log N + results) instead of a full scan.
+        """
+        table = self._reversed_name_table()
+        target = suffix[::-1]
+        matches = []
+        i = bisect.bisect_left(table, (target,))
+        while i < len(table) and table[i][0].startswith(target):
+            atom = self.atoms[table[i][1]]
+            if atom_type is None or atom.type == atom_type:
+                matches.append(atom)
+            i += 1
+        return matches
+
     def pattern_match(self, pattern: Dict[str, Any]) -> List[Atom]:
         """
         Simple pattern matching in the AtomSpace
         Pattern format: {"type": "ConceptNode", "name": "agent_*", ...}
         """
+        cache_key = None
+        if set(pattern) <= {"type", "name"}:
+            # Memoize simple type/name queries; a cached result is valid as
+            # long as no atoms have been added since it was computed
+            cache_key = (pattern.get("type"), pattern.get("name"))
+            cached = self._match_cache.get(cache_key)
+            if cached is not None and cached[0] == len(self.atoms):
+                return list(cached[1])
+
+            # Fast path: prefix-glob names ("Task_*") resolve through the
+            # sorted name index instead of scanning every atom
+            name = pattern.get("name", "")
+            atom_type = pattern.get("type")
+            if (
+                name.endswith("*")
+                and "*" not in name[:-1]
+                and (atom_type is None or "*" not in atom_type)
+            ):
+                matches = self.get_atoms_by_name_prefix(name[:-1], atom_type)
+                self._match_cache[cache_key] = (len(self.atoms), matches)
+                return list(matches)
+
+            # Suffix globs ("*_Usage") resolve through the reversed-name
+            # index, the mirror of the prefix path above
+            if (
+                name.startswith("*")
+                and "*" not in name[1:]
+                and (atom_type is None or "*" not in atom_type)
+            ):
+                matches = self.get_atoms_by_name_suffix(name[1:], atom_type)
+                self._match_cache[cache_key] = (len(self.atoms), matches)
+                return list(matches)
+
+            # Substring globs ("*load*") scan the cached name column in
+            # one vectorized pass instead of atom-by-atom
+            if name and (atom_type is None or "*" not in atom_type):
+                matches = self._match_names_vectorized(name, atom_type)
+                if matches is not None:
+                    self._match_cache[cache_key] = (len(self.atoms), matches)
+                    return list(matches)
+
         matches = []
         for atom in self.atoms.values():
             if self._match_atom(atom, pattern):
                 matches.append(atom)
+        if cache_key is not None:
+            self._match_cache[cache_key] = (len(self.atoms), matches)
+            return list(matches)
         return matches
     
     def _match_atom(self, atom: Atom, pattern: Dict[str, Any]) -> bool:
@@ -203,10 +837,9 @@ class AtomSpace:
         if pattern == "*":
             return True
         if "*" in pattern:
-            # Simple wildcard matching
-            import re
-            regex_pattern = pattern.replace("*", ".*")
-            return bool(re.match(f"^{regex_pattern}$", actual))
+            # Compiled once per pattern and cached; the previous code built
+            # and re-parsed the regex for every atom it was tested against
+            return _compile_glob(pattern).match(actual) is not None
         return actual == pattern
     
     def _match_metadata(self, actual: Dict[str, Any], pattern: Dict[str, Any]) -> bool:
@@ -253,14 +886,33 @@ class AtomSpace:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the AtomSpace"""
+        # Totals, the type distribution and the graph edge count are
+        # maintained incrementally on the write path, so this is
+        # O(number of types), not O(atoms)
+        total = len(self.atoms)
         return {
-            "total_atoms": len(self.atoms),
-            "total_nodes": sum(1 for a in self.atoms.values() if isinstance(a, Node)),
-            "total_links": sum(1 for a in self.atoms.values() if isinstance(a, Link)),
-            "types": {t: len(ids) for t, ids in self.type_index.items()},
-            "graph_density": nx.density(self.graph) if self.graph.number_of_nodes() > 0 else 0
+            "total_atoms": total,
+            "total_nodes": self._node_count,
+            "total_links": self._link_count,
+            "types": dict(self._type_counts),
+            "graph_density": (
+                self._edge_count / (total * (total - 1)) if total > 1 else 0
+            ),
         }
     
+    def freeze(self) -> "FrozenAtomSpace":
+        """Snapshot this AtomSpace into a compact read-only representation."""
+        return FrozenAtomSpace(self)
+
+    def iter_atoms(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield each atom's dict representation lazily, for streaming
+        consumers that would otherwise pay export_to_dict's full
+        materialized copy just to filter or count.
+        """
+        for atom in self.atoms.values():
+            yield atom.to_dict()
+
     def export_to_dict(self) -> Dict[str, Any]:
         """Export AtomSpace to dictionary"""
         return {
@@ -269,6 +921,18 @@ class AtomSpace:
             "stats": self.get_stats()
         }
     
+    def export_to_json(self) -> bytes:
+        """
+        Export AtomSpace as JSON bytes.
+
+        Uses orjson when installed (C-level encoder, also serializes the
+        dataclass metadata records natively); falls back to stdlib json.
+        """
+        data = self.export_to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, default=lambda o: o.__dict__ if hasattr(o, "__dict__") else str(o)).encode()
+
     def import_from_dict(self, data: Dict[str, Any]):
         """Import AtomSpace from dictionary"""
         self.name = data.get("name", self.name)
@@ -292,6 +956,64 @@ class AtomSpace:
                 )
 
 
+class FrozenAtomSpace:
+    """
+    Read-only, contiguous snapshot of an AtomSpace.
+
+    Captures the struct-of-arrays columns (including CSR adjacency), the
+    sorted name table and the stats in one pass, so the query/export phase
+    of a workload runs against compact precomputed data instead of the
+    mutable dict-of-objects storage.
+    """
+
+    __slots__ = ("name", "columns", "stats", "_atoms", "_names")
+
+    def __init__(self, space: "AtomSpace"):
+        self.name = space.name
+        self.columns = space.to_arrays()
+        self.stats = space.get_stats()
+        self._atoms = list(space.atoms.values())
+        # Sorted (name, row) pairs backing atoms_with_name_prefix, the
+        # snapshot counterpart of AtomSpace.get_atoms_by_name_prefix
+        self._names = sorted(
+            (atom.name, row) for row, atom in enumerate(self._atoms)
+        )
+
+    def __len__(self) -> int:
+        return len(self._atoms)
+
+    def atoms_with_name_prefix(self, prefix: str) -> List[Atom]:
+        """
+        All atoms whose name starts with prefix, via binary search over
+        the frozen name table.
+        """
+        table = self._names
+        matches = []
+        i = bisect.bisect_left(table, (prefix,))
+        while i < len(table) and table[i][0].startswith(prefix):
+            matches.append(self._atoms[table[i][1]])
+            i += 1
+        return matches
+
+    def atoms_of_type(self, atom_type: str) -> List[Atom]:
+        """All atoms of the given type, via the coded type column."""
+        type_table = self.columns["type_table"]
+        try:
+            code = type_table.index(atom_type)
+        except ValueError:
+            return []
+        rows = np.nonzero(self.columns["type_codes"] == code)[0]
+        return [self._atoms[i] for i in rows]
+
+    def export_to_dict(self) -> Dict[str, Any]:
+        """Export the snapshot in the same format as AtomSpace.export_to_dict."""
+        return {
+            "name": self.name,
+            "atoms": [atom.to_dict() for atom in self._atoms],
+            "stats": self.stats,
+        }
+
+
 class CognitiveOrchestrator:
     """
     Orchestrates multiple AtomSpaces for multi-agent cognitive architecture
@@ -1,6 +1,14 @@
+import os
+
 from agent import Agent, UserMessage
+from python.helpers.neuro_personality import NeuroPersonality
+from python.helpers.ontogenetic_kernel import OntogeneticKernel
+from python.helpers.print_style import PrintStyle
 from python.helpers.tool import Tool, Response
 
+# Resolved once at import; the flag doesn't change mid-process
+_NEURO_VERBOSE = os.environ.get("NEURO_VERBOSE", "false").lower() == "true"
+
 
 class Delegation(Tool):
 
@@ -46,10 +54,6 @@ class Delegation(Tool):
         # Get inheritance factor from config or kwargs
         inheritance_factor = kwargs.get("inheritance_factor", 0.7)
         
-        # Create child personality through inheritance
-        from python.helpers.neuro_personality import NeuroPersonality
-        from python.helpers.ontogenetic_kernel import OntogeneticKernel
-        
         # Inherit personality tensor
         child_tensor = parent_personality.personality.inherit(
             inheritance_factor=inheritance_factor
@@ -67,11 +71,16 @@ class Delegation(Tool):
         # Inherit kernel if parent has one
         child_kernel = None
         if parent_kernel:
-            # Create child through kernel reproduction
-            from python.helpers.ontogenetic_kernel import initialize_neuro_kernel
-            temp_kernel = initialize_neuro_kernel()  # Temporary second parent
-            child_kernel = parent_kernel.reproduce(temp_kernel)
-            child_kernel.personality = child_personality
+            # Inherit with drift: mutate the parent genome directly instead
+            # of crossing it with a throwaway default kernel, so the child
+            # descends from its actual parent rather than a template
+            child_genome = parent_kernel.genome.mutate(
+                mutation_rate=1.0 - inheritance_factor
+            )
+            child_kernel = OntogeneticKernel(
+                genome=child_genome,
+                personality=child_personality,
+            )
             child_kernel.apply_to_personality()
         
         # Set personality in subordinate's data
@@ -79,10 +88,7 @@ class Delegation(Tool):
         subordinate.data["ontogenetic_kernel"] = child_kernel
         
         # Log inheritance if verbose mode
-        import os
-        verbose = os.environ.get("NEURO_VERBOSE", "false").lower() == "true"
-        if verbose:
-            from python.helpers.print_style import PrintStyle
+        if _NEURO_VERBOSE:
             PrintStyle(font_color="magenta", padding=False).print(
                 f"🎭 Agent {subordinate.number} inherited personality from Agent {self.agent.number} "
                 f"(factor: {inheritance_factor:.2f})"
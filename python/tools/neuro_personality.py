@@ -38,6 +38,7 @@ class NeuroPersonality(Tool):
             )
         
         try:
+            pre_json = None
             if method == "get_state":
                 result = self._get_state(personality, kernel, **kwargs)
             elif method == "get_emotional_state":
@@ -49,12 +50,12 @@ class NeuroPersonality(Tool):
             elif method == "get_fitness":
                 result = self._get_fitness(kernel, **kwargs)
             elif method == "export_state":
-                result = self._export_state(personality, kernel, **kwargs)
+                result, pre_json = self._export_state(personality, kernel, **kwargs)
             else:
                 result = {"error": f"Unknown method: {method}"}
-            
+
             return Response(
-                message=self._format_result(result),
+                message=self._format_result(result, pre_json=pre_json),
                 break_loop=False
             )
             
@@ -169,30 +170,37 @@ class NeuroPersonality(Tool):
         }
     
     def _export_state(self, personality, kernel, **kwargs):
-        """Export complete personality and kernel state"""
+        """
+        Export complete personality and kernel state.
+
+        Returns (result, pre_json) — when the export itself is the whole
+        result, pre_json carries its serialization so _format_result can
+        reuse it instead of dumping the same structure a second time.
+        """
         export_data = {
             "personality": personality.to_dict(),
             "kernel": kernel.to_dict() if kernel else None,
         }
-        
+        payload = json.dumps(export_data, indent=2)
+
         # Optionally save to file
         save_to_file = kwargs.get("save_to_file", False)
         if save_to_file:
             filename = kwargs.get("filename", f"neuro_state_agent_{self.agent.number}.json")
-            import json
             with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+                f.write(payload)
             return {
                 "success": True,
                 "saved_to": filename,
                 "data": export_data
-            }
-        
-        return export_data
-    
-    def _format_result(self, result):
+            }, None
+
+        return export_data, payload
+
+    def _format_result(self, result, pre_json=None):
         """Format result as readable string"""
         if isinstance(result, dict) and "error" in result:
             return f"❌ {result['error']}"
-        
-        return f"🎭 Agent-Neuro Personality Result:\n```json\n{json.dumps(result, indent=2)}\n```"
+
+        payload = pre_json if pre_json is not None else json.dumps(result, indent=2)
+        return f"🎭 Agent-Neuro Personality Result:\n```json\n{payload}\n```"